@@ -0,0 +1,158 @@
+"""
+Dispatch cost of liveStats, globalStats and tracked stats updates on the
+3-screen layout: the previous per-message widget tree walk of UIController
+against the subscription registry joined by ScreenWindow.
+
+Reports the lookup alone (finding the target widgets) and the full dispatch
+including the widgets' own update work.
+
+Run from the repository root:
+    python -m benchmarks.bench_dispatch --messages 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QRect
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from ui.ring_manager import RingManager
+from ui.screen_window import ScreenWindow
+from ui.screens.bar_chart_info_screen import BarChartInfoScreen
+from ui.screens.live_stats_screen import LiveStatsScreen
+from ui.subscriptions import SubscriptionRegistry, TRACKED_STATS
+from ui.ui_setup import get_ring_screen_index, _FakeScreen
+from utils.enums import MessageType
+from utils.messages import as_message
+
+SCREENS = 3
+
+LIVE_STATS = as_message({
+    "type": "liveStats", "currentSpeed": 20, "currentBox": 4220, "totalBoxes": 5000,
+    "remainingTime": 900, "currentPallet": 12, "totalPallets": 200,
+})
+GLOBAL_STATS = as_message({
+    "type": "globalStats",
+    "chart": {"units": "min", "bars": [
+        {"label": "Max. Speed", "value": 120},
+        {"label": "Reduced Speed", "value": 30},
+        {"label": "Stopped", "value": 5},
+    ]},
+    "statMetric": "Avg. Speed", "statValue": "20", "statUnits": "pick/min",
+})
+TRACKED_DATA = {"units": "min", "bars": [
+    {"label": "Max. Speed", "value": 120},
+    {"label": "Reduced Speed", "value": 30},
+    {"label": "Stopped", "value": 5},
+]}
+
+
+def get_all_screen_widgets(screen):
+    """UIController._get_all_screen_widgets before the subscription registry."""
+    widgets = []
+    if hasattr(screen, "alt_widget_0"):
+        widgets.append(screen.alt_widget_0)
+    if hasattr(screen, "alt_widget_1"):
+        widgets.append(screen.alt_widget_1)
+    elif hasattr(screen, "content_widget"):
+        widgets.append(screen.content_widget)
+    return widgets
+
+
+def find_class_widgets(widget, widget_class):
+    """UIController._find_class_widgets before the subscription registry."""
+    found = []
+    if isinstance(widget, widget_class):
+        found.append(widget)
+    elif hasattr(widget, 'findChildren'):
+        children = widget.findChildren(QWidget)
+        for child in children:
+            found.extend(find_class_widgets(child, widget_class))
+    return found
+
+
+def walk_lookup(screens):
+    """Targets of one liveStats, one globalStats and one tracked stats update, found by walking."""
+    targets = []
+    for widget_class in (LiveStatsScreen, BarChartInfoScreen, BarChartInfoScreen):
+        for screen in screens:
+            for widget in get_all_screen_widgets(screen):
+                targets.extend(find_class_widgets(widget, widget_class))
+    return targets
+
+
+def walk_dispatch(screens):
+    for screen in screens:
+        for widget in get_all_screen_widgets(screen):
+            for live_stats_widget in find_class_widgets(widget, LiveStatsScreen):
+                live_stats_widget.update_live_stats(LIVE_STATS)
+    for screen in screens:
+        for widget in get_all_screen_widgets(screen):
+            for barchart_widget in find_class_widgets(widget, BarChartInfoScreen):
+                if hasattr(barchart_widget, "chart_view"):
+                    widget.update_global_stats(GLOBAL_STATS)
+    for screen in screens:
+        for widget in get_all_screen_widgets(screen):
+            for barchart_widget in find_class_widgets(widget, BarChartInfoScreen):
+                if hasattr(barchart_widget, "chart_view"):
+                    barchart_widget.chart_view.receive_data(TRACKED_DATA)
+
+
+def registry_lookup(registry):
+    targets = []
+    for topic in (MessageType.LIVE_STATS, MessageType.GLOBAL_STATS, TRACKED_STATS):
+        targets.extend(registry.subscribers(topic))
+    return targets
+
+
+def registry_dispatch(registry):
+    registry.publish(MessageType.LIVE_STATS, LIVE_STATS)
+    registry.publish(MessageType.GLOBAL_STATS, GLOBAL_STATS)
+    registry.publish(TRACKED_STATS, TRACKED_DATA)
+
+
+def time_per_call(func, arg, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func(arg)
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000, help="update rounds per measurement")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    ring_manager = RingManager()
+    ring_index = get_ring_screen_index(SCREENS)
+    screens = [
+        ScreenWindow(_FakeScreen(QRect(0, i * 400, 640, 400)), i, SCREENS, None, ring_manager, is_ring_screen=(i == ring_index))
+        for i in range(SCREENS)
+    ]
+    registry = SubscriptionRegistry()
+    for screen in screens:
+        registry.extend(screen.subscriptions)
+
+    widget_count = sum(len(screen.findChildren(QWidget)) for screen in screens)
+    print(f"Layout: {SCREENS} screens, {widget_count} widgets, {len(registry)} subscriptions")
+    assert len(walk_lookup(screens)) == len(registry_lookup(registry)), "walk and registry disagree on targets"
+
+    walk = time_per_call(walk_lookup, screens, args.messages)
+    indexed = time_per_call(registry_lookup, registry, args.messages)
+    print(f"Lookup per update round:   walk {walk * 1e6:9.1f} us   registry {indexed * 1e6:7.2f} us   "
+          f"({walk / indexed:.0f}x)")
+
+    walk = time_per_call(walk_dispatch, screens, args.messages)
+    indexed = time_per_call(registry_dispatch, registry, args.messages)
+    print(f"Dispatch per update round: walk {walk * 1e6:9.1f} us   registry {indexed * 1e6:7.2f} us   "
+          f"({walk / indexed:.1f}x)")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
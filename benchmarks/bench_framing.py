@@ -0,0 +1,110 @@
+"""
+Microbenchmark for the TCP framing layer.
+
+Compares the previous reslicing loop of TCPClient._on_ready_read with
+LineFramer on bursts of messages delivered in a single readyRead, and checks
+that the cost per message stays flat as the burst grows: the exponent of a
+log-log fit of time against burst size, over all sizes and as the median of
+several rounds, must stay near 1 (linear); the reslicing loop is printed as
+the quadratic reference.
+
+Run from the repository root:
+    python -m benchmarks.bench_framing
+"""
+
+import argparse
+import json
+import math
+import statistics
+import time
+
+from network.framing import LineFramer
+
+SAMPLE_MESSAGE = {"type": "liveStats", "currentSpeed": 20, "currentBox": 4220, "totalBoxes": 5000}
+
+
+def reslice_frames(data, delimiter=b'\n'):
+    """The framing loop TCPClient used before LineFramer."""
+    buffer = bytearray(data)
+    frames = []
+    while True:
+        pos = buffer.find(delimiter)
+        if pos == -1:
+            break
+        frames.append(buffer[:pos])
+        buffer = buffer[pos + 1:]
+    return frames
+
+
+def framer_frames(data, delimiter=b'\n'):
+    return LineFramer(delimiter).feed(data)
+
+
+def make_burst(count):
+    line = json.dumps(SAMPLE_MESSAGE).encode() + b'\n'
+    return line * count
+
+
+def time_rounds(func, bursts, repeat, min_time=0.02):
+    """
+    Mean CPU time per call of func on each burst, for repeat rounds. CPU
+    time leaves out preemption by other processes; each round times every
+    burst in turn and calls func often enough per burst to take at least
+    min_time.
+    """
+    calls = []
+    for data in bursts:
+        start = time.process_time()
+        func(data)
+        calls.append(max(1, int(min_time / max(time.process_time() - start, 1e-6))))
+    rounds = []
+    for _ in range(repeat):
+        times = []
+        for data, count in zip(bursts, calls):
+            start = time.process_time()
+            for _ in range(count):
+                func(data)
+            times.append((time.process_time() - start) / count)
+        rounds.append(times)
+    return rounds
+
+
+def scaling_exponent(sizes, times):
+    """Least-squares slope of log(time) against log(size): 1 for linear, 2 for quadratic cost."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(t) for t in times]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+            / sum((x - mean_x) ** 2 for x in xs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1250, 2500, 5000, 10000])
+    parser.add_argument("--repeat", type=int, default=7, help="timing rounds; medians over the rounds are reported")
+    parser.add_argument("--max-exponent", type=float, default=1.5,
+                        help="Fail if framing time grows faster than burst size to this power")
+    args = parser.parse_args()
+
+    bursts = [make_burst(count) for count in args.sizes]
+    for count, data in zip(args.sizes, bursts):
+        assert len(framer_frames(data)) == count
+    reslice_rounds = time_rounds(reslice_frames, bursts, args.repeat)
+    framer_rounds = time_rounds(framer_frames, bursts, args.repeat)
+
+    print(f"{'burst':>8} {'reslice ms':>12} {'framer ms':>11} {'framer us/msg':>14} {'speedup':>8}")
+    for i, count in enumerate(args.sizes):
+        old = statistics.median(times[i] for times in reslice_rounds)
+        new = statistics.median(times[i] for times in framer_rounds)
+        print(f"{count:>8} {old * 1e3:>12.2f} {new * 1e3:>11.2f} {new / count * 1e6:>14.3f} {old / new:>7.1f}x")
+
+    exponent = statistics.median(scaling_exponent(args.sizes, times) for times in framer_rounds)
+    reference = statistics.median(scaling_exponent(args.sizes, times) for times in reslice_rounds)
+    print(f"\nTime ~ burst size^k from {args.sizes[0]} to {args.sizes[-1]} messages: "
+          f"framer k = {exponent:.2f}, reslice k = {reference:.2f}")
+    if exponent > args.max_exponent:
+        raise SystemExit(f"Framing cost is not linear (k = {exponent:.2f} > {args.max_exponent})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""
+End-to-end state-to-pixel latency benchmark.
+
+Runs the real UI offscreen against tools.robot_simulator, wired like
+main.py, and injects state transitions under a range of background loads
+(rotation and liveStats messages, split evenly). Each transition is timed
+from the simulator writing it to the loopback socket until the end of the
+first paint whose frame shows the new state's colour:
+  - RingScreen: the state ring graphic in the new colour,
+  - RingViewWidget: the newest ring, sampled at its radius.
+Frames are only grabbed after paints while a transition is pending, and only
+eight points on the ring are checked: the checks run on the GUI thread, so a
+slow check delays the frames it is measuring.
+
+Exits with status 1 if the p99 latency of any load exceeds --budget-ms or a
+transition never reached the screen, so regressions in the state path
+(e.g. UIController.update_state) fail the run. The default run takes about
+50 s; a run that falls far behind is stopped and fails.
+
+Reference run with the defaults: one vCPU Xeon VM, Python 3.11, PyQt6 6.11,
+offscreen platform, simulator in the same process. Over six runs p99 was
+28-71 ms at every load, against the 200 ms default budget. Slower machines
+may need a larger --budget-ms.
+
+Run from the repository root:
+    python -m benchmarks.bench_latency --loads 0,500,2000 --transitions 30 --budget-ms 200
+"""
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEvent, QObject, QPointF, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from main import create_tcp_client, connect_client
+from network.network_worker import ThreadedTCPClient
+from tools.robot_simulator import RobotSimulator, build_parser as build_simulator_parser
+from ui.screens.ring_screen import RingScreen
+from ui.ui_controller import UIController
+from ui.ui_setup import launch_ui, get_ring_screen_index
+
+# Injected transitions; neighbours differ in colour so the new one is recognisable.
+TRANSITIONS = (("stopped", "red"), ("normal", "green"), ("reduced_speed", "yellow"), ("normal", "green"))
+
+# Hue (degrees) of each state colour; see RingManager and the ring SVGs.
+HUES = {"red": 0, "yellow": 60, "green": 120, "blue": 240}
+
+MIN_ALPHA = 4
+MIN_SATURATION = 128
+# Fraction of the RingScreen ring graphic's radius that is sampled.
+RING_SAMPLE_RADIUS = 0.95
+
+
+def colour_name(color):
+    """Name of the state colour closest to a pixel, or None for transparent, dark or grey pixels."""
+    if color.alpha() < MIN_ALPHA or color.saturation() < MIN_SATURATION or color.value() < 64:
+        return None
+    hue = color.hsvHue()
+    return min(HUES, key=lambda name: min(abs(hue - HUES[name]), 360 - abs(hue - HUES[name])))
+
+
+def circle_shows(image, center, radius, colour):
+    """Whether any of eight points on a circle of the image is in the given state colour."""
+    for angle in range(0, 360, 45):
+        point = QPointF(center.x() + radius * math.cos(math.radians(angle)),
+                        center.y() + radius * math.sin(math.radians(angle))).toPoint()
+        if image.valid(point) and colour_name(image.pixelColor(point)) == colour:
+            return True
+    return False
+
+
+def ring_screen_shows(widget, colour):
+    # Only the ring graphic is grabbed; its gradient is opaque towards the outer edge.
+    view = widget.view
+    rect = view.mapFromScene(widget.svg_proxy.sceneBoundingRect()).boundingRect()
+    image = view.viewport().grab(rect).toImage()
+    radius = RING_SAMPLE_RADIUS * widget.svg_size / 2 * widget.container.scale() * view.transform().m11()
+    return circle_shows(image, QPointF(image.width() / 2, image.height() / 2), radius, colour)
+
+
+def ring_view_shows(widget, colour):
+    snapshot = widget.ring_manager.snapshot
+    # The newest ring is only painted once all rings are, as it is the thinnest.
+    if not snapshot or len(snapshot) != widget.ring_manager.ring_count:
+        return False
+    image = widget.grab().toImage()
+    return circle_shows(image, widget.mapFromGlobal(widget.ring_manager.center), snapshot[-1].radius, colour)
+
+
+class PaintProbe(QObject):
+    """Times the first paint of a widget that shows the expected colour after a transition was sent."""
+
+    def __init__(self, name, widget, shows, paint_target=None):
+        super().__init__()
+        self.name = name
+        self.widget = widget
+        self.shows = shows
+        self.expected = None
+        self.sent_at = None
+        self.latencies = []
+        self._check_queued = False
+        (paint_target or widget).installEventFilter(self)
+
+    def expect(self, colour, sent_at):
+        self.expected = colour
+        self.sent_at = sent_at
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and self.expected is not None and not self._check_queued:
+            # Check once the paint has finished.
+            self._check_queued = True
+            QTimer.singleShot(0, self._check)
+        return False
+
+    def _check(self):
+        self._check_queued = False
+        if self.expected is None:
+            return
+        painted_at = time.perf_counter()
+        if self.shows(self.widget, self.expected):
+            self.latencies.append(painted_at - self.sent_at)
+            self.expected = None
+
+    def give_up(self):
+        if self.expected is not None:
+            self.latencies.append(math.inf)
+            self.expected = None
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def report(load, by_probe, budget_ms):
+    """Prints the latency percentiles of one load; returns whether it failed the budget."""
+    failed = False
+    print(f"Background load {load:,.0f} msg/s:")
+    for name, latencies in by_probe.items():
+        missed = sum(1 for latency in latencies if math.isinf(latency))
+        ms = [latency * 1000 for latency in latencies]
+        if not ms:
+            print(f"  {name:15} no samples")
+            failed = True
+            continue
+        p99 = percentile(ms, 0.99)
+        failed |= p99 > budget_ms
+        print(f"  {name:15} p50 {statistics.median(ms):7.1f} ms   p95 {percentile(ms, 0.95):7.1f} ms   "
+              f"p99 {p99:7.1f} ms   max {max(ms):7.1f} ms   ({len(ms) - missed} rendered, {missed} missed)",
+              flush=True)
+    return failed
+
+
+class LatencyRun:
+    """Steps through the load levels, injecting one transition per interval and collecting probe results."""
+
+    def __init__(self, app, simulator, probes, config):
+        self.app = app
+        self.simulator = simulator
+        self.probes = probes
+        self.config = config
+        self.loads = list(config.loads)
+        self.load = None
+        self.transition = 0
+        self.completed = 0
+        self.failed = False
+
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.step)
+
+    def start(self):
+        # Give the client time to connect and the first frames to settle.
+        QTimer.singleShot(int(self.config.warmup * 1000), lambda: self.timer.start(int(self.config.interval * 1000)))
+        # Stop a run whose event loop falls far behind instead of letting it run on.
+        planned = self.config.warmup + len(self.loads) * self.config.transitions * self.config.interval
+        QTimer.singleShot(int((2 * planned + 10) * 1000), self.time_out)
+
+    def time_out(self):
+        print(f"[Latency] Run timed out after {self.completed} of {len(self.config.loads)} loads")
+        self.timer.stop()
+        self.app.quit()
+
+    def set_load(self, load):
+        self.load = load
+        self.simulator.config.rotation_rate = load / 2
+        self.simulator.config.live_stats_rate = load / 2
+        self.transition = 0
+        for probe in self.probes:
+            probe.latencies = []
+
+    def step(self):
+        for probe in self.probes:
+            probe.give_up()
+        if self.load is not None and self.transition >= self.config.transitions:
+            self.failed |= report(self.load, {probe.name: probe.latencies for probe in self.probes},
+                                  self.config.budget_ms)
+            self.completed += 1
+            self.load = None
+        if self.load is None:
+            if not self.loads:
+                self.timer.stop()
+                self.app.quit()
+                return
+            self.set_load(self.loads.pop(0))
+
+        state, colour = TRANSITIONS[self.transition % len(TRANSITIONS)]
+        self.transition += 1
+        sent_count = len(self.simulator.injected_sent)
+        self.simulator.inject({"type": "state", "state": state})
+        # The handler thread sends on its next 1 ms tick; wait for the timestamp.
+        deadline = time.perf_counter() + 0.5
+        while len(self.simulator.injected_sent) == sent_count and time.perf_counter() < deadline:
+            time.sleep(0.0002)
+        if len(self.simulator.injected_sent) == sent_count:
+            print("[Latency] Simulator did not send the transition; is the client connected?")
+            return
+        sent_at = self.simulator.injected_sent[-1]
+        for probe in self.probes:
+            probe.expect(colour, sent_at)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--loads", type=lambda value: [float(load) for load in value.split(",")], default=[0, 500, 2000],
+                        help="comma-separated background messages per second")
+    parser.add_argument("--transitions", type=int, default=30, help="state transitions per load")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between transitions")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds before the first transition")
+    parser.add_argument("--budget-ms", type=float, default=200.0, help="maximum allowed p99 latency")
+    config = parser.parse_args()
+
+    simulator_config = build_simulator_parser().parse_args([])
+    simulator_config.port = 0
+    simulator_config.state_rate = 0.0
+    simulator_config.rotation_rate = 0.0
+    simulator_config.live_stats_rate = 0.0
+    simulator_config.global_stats_rate = 0.0
+    simulator = RobotSimulator(simulator_config).start()
+
+    app = QApplication(sys.argv)
+    _, screen_windows, ring_manager = launch_ui(app, None, app.quit)
+    controller = UIController(ring_manager, screen_windows)
+    client = create_tcp_client(simulator_config.host, simulator.port)
+    connect_client(client, controller)
+
+    ring_window = screen_windows[get_ring_screen_index(len(screen_windows))]
+    probes = [PaintProbe("RingViewWidget", ring_window.ring_view, ring_view_shows)]
+    if isinstance(ring_window.content_widget, RingScreen):
+        ring_screen = ring_window.content_widget
+        probes.append(PaintProbe("RingScreen", ring_screen, ring_screen_shows, ring_screen.view.viewport()))
+
+    run = LatencyRun(app, simulator, probes, config)
+    run.start()
+    QTimer.singleShot(0, client.connect_to_robot)
+    app.exec()
+
+    if isinstance(client, ThreadedTCPClient):
+        client.stop()
+    simulator.stop()
+
+    if run.failed or run.completed < len(config.loads):
+        print(f"FAILED: p99 state-to-pixel latency above the {config.budget_ms:.0f} ms budget or not measured")
+        sys.exit(1)
+    print(f"OK: p99 state-to-pixel latency within the {config.budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Load benchmark of the full message pipeline against the local robot simulator.
+
+Starts tools.robot_simulator in the background, builds the real UI (offscreen
+if no display is available) wired exactly like main.py, and reports
+throughput, dropped animation frames and CPU use of the UI process.
+
+Run from the repository root; accepts every simulator option:
+    python -m benchmarks.bench_load --duration 10 --rotation-rate 2000 --live-stats-rate 200
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+from main import create_tcp_client, connect_client
+from network.network_worker import ThreadedTCPClient
+from tools.robot_simulator import RobotSimulator, build_parser
+from ui.ui_controller import UIController
+from ui.ui_setup import launch_ui
+
+
+class FrameMonitor:
+    """Records animation frame times and counts frames missed against the scheduler's current interval."""
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.last = None
+        self.frames = 0
+        self.dropped = 0
+        self.worst_gap = 0.0
+
+    def on_frame(self):
+        now = time.perf_counter()
+        if self.last is not None:
+            gap = now - self.last
+            self.worst_gap = max(self.worst_gap, gap)
+            self.dropped += max(0, round(gap * 1000 / self.scheduler.interval) - 1)
+        self.last = now
+        self.frames += 1
+
+
+def main():
+    parser = build_parser()
+    parser.set_defaults(port=0, duration=10.0)
+    config = parser.parse_args()
+
+    simulator = RobotSimulator(config).start()
+
+    app = QApplication(sys.argv)
+    _, screen_windows, ring_manager = launch_ui(app, None, app.quit)
+    controller = UIController(ring_manager, screen_windows)
+
+    client = create_tcp_client(config.host, simulator.port)
+    conflator = connect_client(client, controller)
+
+    received = {"messages": 0, "errors": 0}
+    client.message_received.connect(lambda message: received.__setitem__("messages", received["messages"] + 1))
+    client.error_occurred.connect(lambda error: received.__setitem__("errors", received["errors"] + 1))
+
+    monitor = FrameMonitor(ring_manager.scheduler)
+    ring_manager.scheduler.frame.connect(monitor.on_frame)
+
+    QTimer.singleShot(0, client.connect_to_robot)
+    QTimer.singleShot(int(config.duration * 1000), app.quit)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    app.exec()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    client_stats = client.stats()
+
+    if isinstance(client, ThreadedTCPClient):
+        client.stop()
+    simulator.stop()
+
+    sent = simulator.stats()
+    print(f"Duration:            {wall:.1f} s")
+    print(f"Simulator sent:      {sent.get('lines', 0)} lines ({sent.get('malformed', 0)} malformed), "
+          f"{sent.get('connections', 0)} connections, {sent.get('disconnects', 0)} disconnects")
+    print(f"Client decoded:      {received['messages']} messages, {received['errors']} errors "
+          f"({received['messages'] / wall:.0f} msg/s)")
+    print(f"Receive buffer:      {client_stats}")
+    if conflator is not None:
+        print(f"Conflator:           {conflator.stats()}")
+    if controller.frame_synced:
+        print(f"State model:         {controller.model.stats()}")
+    print(f"Animation frames:    {monitor.frames}, dropped {monitor.dropped}, worst gap {monitor.worst_gap * 1000:.1f} ms, "
+          f"{ring_manager.skipped_frame_count} without visible change")
+    print(f"Frame scheduler:     {ring_manager.scheduler.stats()}")
+    print(f"CPU use (UI process): {100 * cpu / wall:.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Ring rendering benchmark: the gradient and sprite backends of RingViewWidget.
+
+Paints the ring snapshots of a state's cycle (one per frame) into a
+screen-sized image, with the ring center on the image (ring screen) and
+below it (neighbouring screen), and reports the paint time per frame and
+the pixel difference of the sprite backend against the gradient output.
+
+Run from the repository root:
+    python -m benchmarks.bench_rings --width 1280 --height 800
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QGuiApplication, QImage, QPainter
+
+from config.settings import FRAME_INTERVAL_MS
+from ui.ring_manager import NORMAL_STATE, WARNING_STATE, ERROR_STATE, IDLE_STATE, RING_STATES, ring_snapshot
+from ui.widgets.ring_renderer import GradientRingRenderer, SpriteRingRenderer
+
+STATES = {"normal": NORMAL_STATE, "warning": WARNING_STATE, "error": ERROR_STATE, "idle": IDLE_STATE}
+
+
+def frames(state):
+    """Snapshots of each frame of one steady-state ring lifetime, with a new ring every state.frequency ms."""
+    created = np.arange(0, 2 * state.lifetime, state.frequency, dtype=float)
+    state_index = np.full(len(created), RING_STATES.index(state))
+    speed = np.full(len(created), state.speed)
+    for now in range(state.lifetime, 2 * state.lifetime, FRAME_INTERVAL_MS):
+        born = created <= now
+        yield ring_snapshot(created[born], state_index[born], speed[born], now)[1]
+
+
+def paint(renderer, image, center, snapshot):
+    image.fill(0)
+    painter = QPainter(image)
+    renderer.paint(painter, center, snapshot)
+    painter.end()
+
+
+def difference(a, b):
+    """Largest and mean channel difference, and the fraction of pixels differing by more than 4 levels."""
+    bytes_a = a.constBits().asstring(a.sizeInBytes())
+    bytes_b = b.constBits().asstring(b.sizeInBytes())
+    diffs = [abs(x - y) for x, y in zip(bytes_a, bytes_b)]
+    pixels = len(diffs) // 4
+    differing = sum(1 for i in range(0, len(diffs), 4) if max(diffs[i:i + 4]) > 4)
+    return max(diffs), sum(diffs) / len(diffs), differing / pixels
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--height", type=int, default=768)
+    parser.add_argument("--parity-every", type=int, default=15, help="compare every n-th frame")
+    args = parser.parse_args()
+
+    app = QGuiApplication(sys.argv)
+    gradient_image = QImage(args.width, args.height, QImage.Format.Format_ARGB32_Premultiplied)
+    sprite_image = QImage(args.width, args.height, QImage.Format.Format_ARGB32_Premultiplied)
+    centers = {
+        "ring screen": QPointF(args.width / 2, args.height / 2),
+        "next screen": QPointF(args.width / 2, args.height * 1.5),
+    }
+    gradient = GradientRingRenderer()
+    sprite = SpriteRingRenderer()
+
+    for position, center in centers.items():
+        for name, state in STATES.items():
+            ring_frames = list(frames(state))
+            # Warm the sprite cache, as it is after the first ring of a state.
+            for snapshot in ring_frames:
+                paint(sprite, sprite_image, center, snapshot)
+
+            timings = {}
+            for label, renderer, image in (("gradient", gradient, gradient_image), ("sprite", sprite, sprite_image)):
+                start = time.perf_counter()
+                for snapshot in ring_frames:
+                    paint(renderer, image, center, snapshot)
+                timings[label] = (time.perf_counter() - start) / len(ring_frames)
+
+            worst = (0, 0.0, 0.0)
+            for snapshot in ring_frames[::args.parity_every]:
+                paint(gradient, gradient_image, center, snapshot)
+                paint(sprite, sprite_image, center, snapshot)
+                result = difference(gradient_image, sprite_image)
+                worst = tuple(max(w, r) for w, r in zip(worst, result))
+
+            print(f"{position:11} {name:8} gradient {timings['gradient'] * 1000:6.2f} ms   "
+                  f"sprite {timings['sprite'] * 1000:6.2f} ms   ({timings['gradient'] / timings['sprite']:.1f}x)   "
+                  f"max diff {worst[0]:3d}, mean {worst[1]:.2f}, {worst[2] * 100:.2f} % of pixels > 4")
+    print(f"Sprite cache: {sprite.stats()}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
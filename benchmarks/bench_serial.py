@@ -0,0 +1,112 @@
+"""
+Serial IMU ingestion benchmark.
+
+1. Parse throughput of the IMU reader for the text and binary protocols.
+2. End-to-end emission latency: a pty emulator (tools.imu_emulator) streams
+   counting rolls, and the time from writing a sample to its rotation arriving
+   on the Qt main thread is measured.
+3. Reconnect time: with dropouts longer than the watchdog timeout, the time
+   from the emulator resuming to the first rotation received afterwards.
+
+The rotation filter is disabled so emitted values can be matched to samples.
+POSIX only. Run from the repository root:
+    python -m benchmarks.bench_serial --rate 1000 --duration 10 --protocol binary
+"""
+
+import argparse
+import statistics
+import time
+
+from PyQt6.QtCore import QCoreApplication, QTimer, Qt
+
+from config.settings import AXIS_SIGN, ROTATION_OFFSET
+from network.imu_protocol import encode_frame, FRAME_ROTATION
+from network.serial_reader import ImuDevice, SerialReader, ALL_SCREENS
+from tools.imu_emulator import ImuEmulator, SEQUENCE_MODULO, build_parser as build_emulator_parser
+
+
+def bench_parse(protocol, samples, chunk_size=4096):
+    if protocol == "binary":
+        stream = b"".join(encode_frame(FRAME_ROTATION, i % 360 - 180) for i in range(samples))
+    else:
+        stream = b"".join(b"r:%.3f\n" % (i % 360 - 180) for i in range(samples))
+    chunks = [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+    device = ImuDevice(None, protocol=protocol, rotation_filter=None)
+    start = time.perf_counter()
+    for chunk in chunks:
+        device.parse(chunk)
+        device._pending.clear()
+    elapsed = time.perf_counter() - start
+    assert device.sample_count == samples, device.stats()
+    return samples / elapsed
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def bench_live(config):
+    emulator = ImuEmulator(config)
+    reader = SerialReader([(emulator.slave_path, ALL_SCREENS)], protocol=config.protocol, rotation_filter=None)
+    app = QCoreApplication.instance() or QCoreApplication([])
+
+    latencies = []
+    arrivals = []
+
+    def on_rotation(rotation, screen):
+        now = time.perf_counter()
+        arrivals.append(now)
+        sequence = round((rotation - ROTATION_OFFSET) * AXIS_SIGN) % SEQUENCE_MODULO
+        sent = emulator.sent_times.get(sequence)
+        if sent is not None:
+            latencies.append(now - sent)
+
+    reader.rotation_received.connect(on_rotation, type=Qt.ConnectionType.QueuedConnection)
+    emulator.start()
+    reader.start()
+    QTimer.singleShot(int(config.duration * 1000), app.quit)
+    app.exec()
+    reader.running = False
+    reader.wait()
+    emulator.stop()
+
+    reconnects = []
+    for resumed in emulator.resume_times:
+        first = next((arrival for arrival in arrivals if arrival >= resumed), None)
+        if first is not None:
+            reconnects.append(first - resumed)
+    return latencies, reconnects, reader.stats()[emulator.slave_path], emulator.stats()
+
+
+def main():
+    parser = build_emulator_parser()
+    parser.description = __doc__
+    parser.formatter_class = argparse.RawDescriptionHelpFormatter
+    parser.add_argument("--parse-samples", type=int, default=200000)
+    parser.set_defaults(pattern="sequence", rate=1000.0, state_rate=0.0, duration=10.0)
+    config = parser.parse_args()
+    config.pattern = "sequence"
+
+    for protocol in ("text", "binary"):
+        print(f"Parse throughput ({protocol}): {bench_parse(protocol, config.parse_samples):,.0f} samples/s")
+
+    latencies, reconnects, reader_stats, emulator_stats = bench_live(config)
+    print(f"Emulator:            {emulator_stats}")
+    print(f"SerialReader:        {reader_stats}")
+    if latencies:
+        ms = [latency * 1000 for latency in latencies]
+        print(f"Emission latency:    p50 {statistics.median(ms):.2f} ms, p95 {percentile(ms, 0.95):.2f} ms, "
+              f"max {max(ms):.2f} ms over {len(ms)} rotations")
+    else:
+        print("Emission latency:    no rotations received")
+    if reconnects:
+        print(f"Reconnect time:      mean {statistics.mean(reconnects):.2f} s, max {max(reconnects):.2f} s "
+              f"over {len(reconnects)} dropouts")
+    elif config.dropout_every:
+        print("Reconnect time:      no rotation received after a dropout")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Decoder benchmark for the UR real-time stream (port 30003).
+
+Encodes a 500 Hz packet stream with network.ur_realtime.encode_packet, with
+the state changing every few seconds, optionally corrupted by garbage bytes
+between packets and by truncated packets, and feeds it to RealtimeDecoder in
+random TCP-sized chunks. Reports decode throughput and resyncs, and checks
+that every intact packet was decoded and every state change reported.
+
+Run from the repository root:
+    python -m benchmarks.bench_ur_realtime --seconds 60 --garbage-every 500 --truncate-every 2000
+"""
+
+import argparse
+import os
+import random
+import time
+
+from network.ur_realtime import HEADER, RealtimeDecoder, encode_packet
+
+RATE = 500
+# (safety mode, speed scaling) per state, cycled every state_seconds.
+STATE_INPUTS = {
+    "normal": (1, 1.0),
+    "reduced_speed": (2, 1.0),
+    "stopped": (1, 0.0),
+}
+
+
+def build_stream(seconds, state_seconds, garbage_every, truncate_every, rng):
+    """The stream bytes, the number of packets expected intact and the expected state changes."""
+    states = list(STATE_INPUTS)
+    parts = []
+    intact = 0
+    expected_states = []
+    for i in range(int(seconds * RATE)):
+        t = i / RATE
+        state = states[int(t // state_seconds) % len(states)]
+        if not expected_states or expected_states[-1] != state:
+            expected_states.append(state)
+        safety_mode, speed_scaling = STATE_INPUTS[state]
+        packet = encode_packet(t, (0.0, -1.57, 1.57, 0.0, 0.0, 0.001 * i), safety_mode=safety_mode,
+                               speed_scaling=speed_scaling)
+        if garbage_every and i % garbage_every == garbage_every - 1:
+            parts.append(os.urandom(rng.randint(1, 64)))
+        if truncate_every and i % truncate_every == truncate_every - 1:
+            # The decoder takes the truncated packet's header at face value and
+            # loses the packet it overlaps; both are not intact.
+            parts.append(packet[:rng.randint(HEADER.size, len(packet) - 1)])
+            intact -= 1
+            continue
+        parts.append(packet)
+        intact += 1
+    return b"".join(parts), intact, expected_states
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=60.0, help="seconds of robot time at 500 Hz")
+    parser.add_argument("--state-seconds", type=float, default=5.0, help="seconds between state changes")
+    parser.add_argument("--garbage-every", type=int, default=0, help="insert random bytes after every n-th packet")
+    parser.add_argument("--truncate-every", type=int, default=0, help="truncate every n-th packet")
+    parser.add_argument("--max-chunk", type=int, default=4096, help="largest receive chunk in bytes")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    stream, intact, expected_states = build_stream(
+        args.seconds, args.state_seconds, args.garbage_every, args.truncate_every, rng
+    )
+    chunks = []
+    pos = 0
+    while pos < len(stream):
+        size = rng.randint(1, args.max_chunk)
+        chunks.append(stream[pos:pos + size])
+        pos += size
+
+    errors = []
+    decoder = RealtimeDecoder(on_error=errors.append, typed=False)
+    start = time.perf_counter()
+    messages = []
+    for chunk in chunks:
+        messages.extend(decoder.feed(chunk))
+    elapsed = time.perf_counter() - start
+
+    states = [message["state"] for message in messages if message["type"] == "state"]
+    rotations = sum(1 for message in messages if message["type"] == "rotation")
+    print(f"Stream:       {len(stream) / 1e6:.1f} MB in {len(chunks)} chunks, {intact} intact packets")
+    print(f"Decoded:      {decoder.packet_count} packets in {elapsed * 1000:.0f} ms "
+          f"({decoder.packet_count / elapsed:,.0f} packets/s, {args.seconds / elapsed:,.0f}x real time)")
+    print(f"Messages:     {len(states)} state, {rotations} rotation")
+    print(f"Resyncs:      {decoder.resync_count}, {len(errors)} reported, {len(decoder)} bytes left buffered")
+
+    if args.truncate_every:
+        # A truncated packet is decoded from the bytes that follow it, so states may flicker there.
+        failed = decoder.packet_count < intact
+    else:
+        failed = decoder.packet_count != intact or states != expected_states
+    if failed:
+        raise SystemExit(f"Decoded {decoder.packet_count} of {intact} intact packets, states {states} "
+                         f"(expected {expected_states})")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,33 @@ TCP_ENABLED = True
 TCP_HOST = "192.168.1.218"
 TCP_PORT = 30003
 TCP_MESSAGE_DELIMITER = b'\n'
+TCP_CONNECT_TIMEOUT = 3000
+TCP_RECONNECT_INITIAL = 500
+TCP_RECONNECT_MAX = 30000
+TCP_RECONNECT_JITTER = 0.2
+TCP_PROTOCOL = "json"  # "json" (newline-delimited), "ur_realtime" (binary port 30003 stream) or "rtde"
+TCP_TYPED_MESSAGES = True
+TCP_WORKER_THREAD = True
+TCP_QUEUE_MAXSIZE = 1000
+TCP_QUEUE_OVERFLOW = "drop_oldest"  # "drop_oldest", "drop_newest" or "drop_non_state"
+STATE_PRIORITY_LANE = True  # state messages skip queued stats/rotation traffic and are applied without waiting for a frame
+TCP_MAX_FRAME_BYTES = 65536  # longer frames are discarded up to the next delimiter
+TCP_READ_BUFFER_BYTES = 1048576  # socket read buffer limit; 0 = unlimited
+MESSAGE_CONFLATION = True  # only used without FRAME_SYNCED_UPDATES, whose state model conflates itself
+FRAME_SYNCED_UPDATES = True  # messages write a state model that is applied to the widgets once per frame
+SESSION_RECORDING_PATH = None  # e.g. "session.log.gz" to append everything received to a session log
+
+# UR real-time interface (TCP_PROTOCOL = "ur_realtime")
+UR_ROTATION_JOINT = 5
+UR_ROTATION_SIGN = 1
+UR_ROTATION_OFFSET = 0.0
+UR_REDUCED_SPEED_SCALING = 0.99
+UR_STOPPED_SPEED_SCALING = 0.01
+
+# UR RTDE interface (TCP_PROTOCOL = "rtde")
+RTDE_PORT = 30004
+RTDE_FREQUENCY = 30
+RTDE_NOMINAL_PICK_RATE = None  # pick/min at full speed; set to derive liveStats currentSpeed from speed scaling
 
 # IMU Settings
 ROTATION_FROM_IMU = False
@@ -13,12 +40,29 @@ ROTATION_OFFSET = -1.7
 ROTATION_THRESHOLD = 0.1
 IMU_SERIAL_PORT = "COM6"
 IMU_SERIAL_BAUDRATE = 115200
+IMU_DEVICES = None  # [(port, screen index), ...] to rotate each screen by its own IMU; None = IMU_SERIAL_PORT for all screens
+IMU_PROTOCOL = "auto"  # "text" (r:/s: lines), "binary" (CRC-checked frames) or "auto"
+IMU_ROTATION_MODE = "latest"  # rotation emitted once per frame: "latest" sample or "average" of the frame's samples
+IMU_STATS_INTERVAL = 0  # seconds between printed IMU sample rate / drop counters; 0 = off
+ROTATION_FILTER = "one_euro"  # "one_euro", "kalman" or None
+ROTATION_PREDICTION_MS = 30  # how far ahead the filtered rotation is extrapolated
+ROTATION_ONE_EURO_MIN_CUTOFF = 0.5  # Hz
+ROTATION_ONE_EURO_BETA = 0.05
+ROTATION_KALMAN_PROCESS_NOISE = 1e3  # (deg/s^2)^2
+ROTATION_KALMAN_MEASUREMENT_NOISE = 0.25  # deg^2
 
 # UI settings
 GREEN_COLOR = "#00FF00"
 YELLOW_COLOR = "#FFFF00"
 RED_COLOR = "#FF0000"
 BLUE_COLOR = "#0000FF"
+FRAME_INTERVAL_MS = 33
+FRAME_ALIGN_TO_DISPLAY = True  # round frame intervals to whole refresh periods of the primary screen
+FRAME_IDLE_INTERVAL_MS = 100  # low-power frame interval while the robot is idle or finished
+FRAME_BUDGET_MS = 16  # frame handlers running longer count as over budget
+RING_RENDERER = "sprite"  # "sprite" (cached pre-rendered rings) or "gradient" (rasterized per frame)
+RING_SPRITE_CACHE_MB = 16
+RING_SPRITE_MAX_SIZE = 512  # px; larger rings are scaled up from sprites of this size
 
 # Debug Settings
 DEBUG_MODE = True
@@ -36,6 +80,9 @@ HIDE_WINDOW_FROM_TASKBAR = False
 UI_SCREEN_INDICES = [1, 2]
 LIVE_STATS_AVAILABLE = True
 INTERNAL_TIME_COUNTER = True
+STATE_TIMER_WINDOW = "session"  # window of the internal state durations: "session", "hour", "shift" or "today"
+STATE_TIMER_PATH = None  # e.g. "state_durations.json" to keep the state durations across restarts
+SHIFT_START_HOURS = (6, 14, 22)  # local hours at which shifts start, for STATE_TIMER_WINDOW = "shift"
 SWITCH_SCREEN_INTERVAL = 5000
 SCREEN_CLASSES_BY_INDEX = {
     1: ["RingScreen"],
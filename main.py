@@ -1,8 +1,10 @@
 import sys
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QTimer
-from network.tcp_client import TCPClient
-from config.settings import TCP_ENABLED, ROTATION_FROM_IMU
+from network.network_worker import ThreadedTCPClient, create_client
+from network.message_queue import MessageQueue
+from network.message_conflator import MessageConflator
+from config.settings import TCP_ENABLED, TCP_HOST, ROTATION_FROM_IMU, MESSAGE_CONFLATION, TCP_WORKER_THREAD, FRAME_SYNCED_UPDATES
 from ui.ui_setup import launch_ui
 from ui.ui_controller import UIController
 from network.serial_reader import SerialReader
@@ -15,10 +17,9 @@ def main():
 
     app.setStyleSheet("QLabel { color: white; }")
 
-    client = TCPClient()
-
-    if TCP_ENABLED:
-        client.connect_to_robot()
+    client = create_tcp_client()
+    if isinstance(client, ThreadedTCPClient):
+        app.aboutToQuit.connect(client.stop)
 
     try:
         serial_reader = SerialReader()
@@ -36,10 +37,11 @@ def main():
     bg_window, screen_windows, ring_widget = launch_ui(app, client, handle_escape)
 
     controller = UIController(ring_widget, screen_windows)
-    client.message_received.connect(
-                controller.handle_message,
-                type=Qt.ConnectionType.QueuedConnection
-            )
+    conflator = connect_client(client, controller)
+
+    if TCP_ENABLED:
+        # Connect once the event loop runs so the windows are shown first.
+        QTimer.singleShot(0, client.connect_to_robot)
 
     if ROTATION_FROM_IMU:
         serial_reader.rotation_received.connect(
@@ -60,6 +62,47 @@ def main():
     app.exec()
 
 
+def create_tcp_client(host=TCP_HOST, port=None):
+    """Create the robot client, on a worker thread if TCP_WORKER_THREAD is set."""
+    if TCP_WORKER_THREAD:
+        return ThreadedTCPClient(host=host, port=port)
+    # The same bounded queue and overflow policy as the worker's, drained on the GUI thread.
+    return create_client(host=host, port=port, queue=MessageQueue())
+
+
+def connect_client(client, controller):
+    """Route the client's messages and connection state to the controller; returns the conflator, if any."""
+    if client.queue is not None:
+        # Messages are already handed over in batches on the GUI thread.
+        message_connection = Qt.ConnectionType.AutoConnection
+    else:
+        message_connection = Qt.ConnectionType.QueuedConnection
+
+    conflator = None
+    if FRAME_SYNCED_UPDATES:
+        # The controller's state model already keeps only the latest values per frame.
+        client.message_received.connect(
+                    controller.handle_message,
+                    type=message_connection
+                )
+        client.connection_lost.connect(controller.model.reset)
+    elif MESSAGE_CONFLATION:
+        conflator = MessageConflator()
+        client.message_received.connect(
+                    conflator.push,
+                    type=message_connection
+                )
+        client.connection_lost.connect(conflator.reset)
+        conflator.message_ready.connect(controller.handle_message)
+    else:
+        client.message_received.connect(
+                    controller.handle_message,
+                    type=message_connection
+                )
+    client.connection_state_changed.connect(controller.update_connection_state)
+    return conflator
+
+
 def print_time():
     elapsed_time = time.time() - now
     if (elapsed_time > 60):
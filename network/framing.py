@@ -0,0 +1,72 @@
+"""Delimiter-based framing for the newline-delimited TCP message stream."""
+
+
+class LineFramer:
+    """
+    Splits an incoming byte stream into delimiter-terminated frames.
+
+    Complete frames are located by walking the buffer with a read offset, and
+    the consumed prefix is compacted away once per call to feed(), so a burst
+    of N messages costs O(total bytes) instead of O(N * buffer size).
+
+    With max_frame_bytes set, a frame growing past the limit is discarded and
+    the framer resyncs at the next delimiter, so a peer that never sends one
+    cannot grow the buffer without bound.
+    """
+
+    def __init__(self, delimiter=b'\n', max_frame_bytes=None):
+        if not delimiter:
+            raise ValueError("Frame delimiter must not be empty")
+        self.delimiter = bytes(delimiter)
+        self.max_frame_bytes = max_frame_bytes
+        self.resync_count = 0
+        self.discarded_bytes = 0
+        self._buffer = bytearray()
+        self._discarding = False
+
+    def feed(self, data):
+        """Append received bytes and return the list of complete frames."""
+        buffer = self._buffer
+        buffer += data
+
+        frames = []
+        delimiter = self.delimiter
+        step = len(delimiter)
+        limit = self.max_frame_bytes or float("inf")
+        offset = 0
+
+        with memoryview(buffer) as view:
+            while True:
+                pos = buffer.find(delimiter, offset)
+                if pos == -1:
+                    break
+                if self._discarding or pos - offset > limit:
+                    # Tail of an oversized frame: drop it, the next frame is intact.
+                    if not self._discarding:
+                        self.resync_count += 1
+                    self._discarding = False
+                    self.discarded_bytes += pos - offset
+                else:
+                    frames.append(bytes(view[offset:pos]))
+                offset = pos + step
+
+        if offset:
+            del buffer[:offset]
+
+        if len(buffer) > limit:
+            # Keep just enough to recognise a delimiter split across reads.
+            drop = len(buffer) - (step - 1)
+            del buffer[:drop]
+            self.discarded_bytes += drop
+            if not self._discarding:
+                self.resync_count += 1
+                self._discarding = True
+        return frames
+
+    def clear(self):
+        """Discard any partially received frame."""
+        self._buffer.clear()
+        self._discarding = False
+
+    def __len__(self):
+        return len(self._buffer)
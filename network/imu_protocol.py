@@ -0,0 +1,129 @@
+"""
+Compact binary frame format for the IMU serial link.
+
+Frame layout (little-endian):
+    0xAA 0x55 | type (1 byte) | payload length (1 byte) | payload | CRC-16/CCITT
+The CRC (initial value 0xFFFF) covers type, length and payload. Payloads are a
+float32 roll in degrees for rotation frames and a uint8 state code (same codes
+as the text protocol's "s:" lines) for state frames.
+"""
+
+import struct
+from binascii import crc_hqx
+
+SYNC = b"\xaa\x55"
+HEADER = struct.Struct("<2sBB")
+CRC = struct.Struct("<H")
+CRC_INITIAL = 0xFFFF
+MAX_PAYLOAD_SIZE = 32
+
+FRAME_ROTATION = 0x01
+FRAME_STATE = 0x02
+PAYLOAD_FORMATS = {
+    FRAME_ROTATION: struct.Struct("<f"),
+    FRAME_STATE: struct.Struct("<B"),
+}
+
+
+def encode_frame(frame_type, value):
+    payload = PAYLOAD_FORMATS[frame_type].pack(value)
+    body = bytes((frame_type, len(payload))) + payload
+    return SYNC + body + CRC.pack(crc_hqx(body, CRC_INITIAL))
+
+
+class BinaryFrameParser:
+    """
+    Incremental parser for the binary IMU frames.
+
+    Garbage before a sync marker is skipped, and a frame with a bad length or
+    CRC is dropped by searching for the next sync marker one byte further, so
+    corruption costs at most the frames it touches.
+    """
+
+    def __init__(self):
+        self.frame_count = 0
+        self.bad_frame_count = 0
+        self.unknown_frame_count = 0
+        self.resync_count = 0
+        self.discarded_bytes = 0
+        self._buffer = bytearray()
+        self._resyncing = False
+
+    def feed(self, data):
+        """Append received bytes and return the decoded (frame type, value) pairs."""
+        buffer = self._buffer
+        buffer += data
+
+        frames = []
+        append = frames.append
+        find = buffer.find
+        size = len(buffer)
+        offset = 0
+        frame_count = 0
+
+        with memoryview(buffer) as view:
+            while True:
+                pos = find(SYNC, offset)
+                if pos == -1:
+                    # Keep a final byte that may be the first half of a sync marker.
+                    keep = 1 if buffer.endswith(SYNC[:1]) else 0
+                    self._skip(size - keep - offset)
+                    offset = size - keep
+                    break
+                if pos != offset:
+                    self._skip(pos - offset)
+                    offset = pos
+
+                if size - pos < HEADER.size:
+                    break
+                _, frame_type, length = HEADER.unpack_from(buffer, pos)
+                if length > MAX_PAYLOAD_SIZE:
+                    self.bad_frame_count += 1
+                    self._skip(1)
+                    offset = pos + 1
+                    continue
+
+                payload_start = pos + HEADER.size
+                end = payload_start + length + CRC.size
+                if size < end:
+                    break
+                if crc_hqx(view[pos + 2:end - CRC.size], CRC_INITIAL) != CRC.unpack_from(buffer, end - CRC.size)[0]:
+                    self.bad_frame_count += 1
+                    self._skip(1)
+                    offset = pos + 1
+                    continue
+
+                offset = end
+                self._resyncing = False
+                payload_format = PAYLOAD_FORMATS.get(frame_type)
+                if payload_format is None or payload_format.size != length:
+                    self.unknown_frame_count += 1
+                    continue
+                frame_count += 1
+                append((frame_type, payload_format.unpack_from(buffer, payload_start)[0]))
+
+        self.frame_count += frame_count
+        if offset:
+            del buffer[:offset]
+        return frames
+
+    def _skip(self, count):
+        """Count skipped bytes; a run of garbage and bad frames is one resync."""
+        if count > 0:
+            self.discarded_bytes += count
+            if not self._resyncing:
+                self._resyncing = True
+                self.resync_count += 1
+
+    def clear(self):
+        self._buffer.clear()
+        self._resyncing = False
+
+    def stats(self):
+        return {
+            "frames": self.frame_count,
+            "bad_frames": self.bad_frame_count,
+            "unknown_frames": self.unknown_frame_count,
+            "resyncs": self.resync_count,
+            "discarded_bytes": self.discarded_bytes,
+        }
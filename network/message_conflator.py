@@ -0,0 +1,87 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from utils.enums import MessageType
+from utils.messages import as_message
+from config.settings import FRAME_INTERVAL_MS, STATE_PRIORITY_LANE
+
+# Stats messages may carry only the fields that changed, so pending ones are
+# merged instead of replaced to avoid losing values within a frame.
+MERGED_TYPES = {MessageType.LIVE_STATS, MessageType.GLOBAL_STATS}
+
+
+class MessageConflator(QObject):
+    """
+    Collapses incoming messages to the latest one per MessageType and display frame.
+
+    Messages identical to the last one forwarded for their type are dropped,
+    so the controller only does widget work for content that actually changed.
+    With STATE_PRIORITY_LANE, state messages are forwarded without waiting
+    for the frame.
+    """
+    message_ready = pyqtSignal(object)
+
+    def __init__(self, interval=FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self._pending = {}
+        self._last_applied = {}
+        self.immediate_types = {MessageType.STATE} if STATE_PRIORITY_LANE else set()
+
+        self.received_count = 0
+        self.forwarded_count = 0
+        self.conflated_count = 0
+        self.deduplicated_count = 0
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(interval)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def push(self, message):
+        """Queue a message for the next frame, replacing any pending one of the same type."""
+        self.received_count += 1
+        try:
+            message = as_message(message)
+        except ValueError:
+            # Let the controller report invalid messages as before.
+            self.forwarded_count += 1
+            self.message_ready.emit(message)
+            return
+
+        if message.type in self.immediate_types:
+            self._forward(message)
+            return
+
+        pending = self._pending.get(message.type)
+        if pending is not None:
+            self.conflated_count += 1
+            if message.type in MERGED_TYPES:
+                message = pending.merged(message)
+        self._pending[message.type] = message
+
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        """Forward the pending messages that differ from the last ones applied."""
+        pending, self._pending = self._pending, {}
+        for message in pending.values():
+            self._forward(message)
+
+    def _forward(self, message):
+        if self._last_applied.get(message.type) == message:
+            self.deduplicated_count += 1
+            return
+        self._last_applied[message.type] = message
+        self.forwarded_count += 1
+        self.message_ready.emit(message)
+
+    def reset(self):
+        """Forget the last applied messages, e.g. after the connection was lost."""
+        self._last_applied.clear()
+
+    def stats(self):
+        return {
+            "received": self.received_count,
+            "forwarded": self.forwarded_count,
+            "conflated": self.conflated_count,
+            "deduplicated": self.deduplicated_count,
+        }
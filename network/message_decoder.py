@@ -0,0 +1,33 @@
+"""Decoding of framed JSON messages, using orjson when it is installed."""
+
+import json
+from config.settings import TCP_TYPED_MESSAGES
+from utils.messages import as_message
+
+try:
+    import orjson
+    _loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    _loads = json.loads
+    JSON_BACKEND = "json"
+
+
+class MessageDecoder:
+    """
+    Turns one frame into a message.
+
+    In typed mode the frame is validated here, at the network edge, and
+    returned as a typed message struct; otherwise the plain decoded dict is
+    returned and typed downstream. Raises ValueError (including
+    json.JSONDecodeError and UnicodeDecodeError) for frames that cannot be used.
+    """
+
+    def __init__(self, typed=TCP_TYPED_MESSAGES):
+        self.typed = typed
+
+    def decode(self, frame):
+        message = _loads(frame)
+        if self.typed:
+            return as_message(message)
+        return message
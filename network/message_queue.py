@@ -0,0 +1,82 @@
+"""Bounded hand-over queue for decoded messages, with an overload policy and a state priority lane."""
+
+import threading
+import time
+from collections import deque
+from config.settings import TCP_QUEUE_MAXSIZE, TCP_QUEUE_OVERFLOW, STATE_PRIORITY_LANE
+from utils.enums import MessageType
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "drop_non_state")
+
+# Message types that skip queued lower-priority traffic with STATE_PRIORITY_LANE.
+PRIORITY_TYPES = {MessageType.STATE.value}
+
+
+class MessageQueue:
+    """
+    Bounded, thread-safe hand-over queue between the client and the GUI, used
+    from the network thread in worker mode and by TCPClient itself otherwise.
+
+    put() reports whether the queue was empty, so the producer only wakes the
+    consumer once per batch instead of once per message. When full, the
+    drop_non_state policy sacrifices the oldest non-state message so state
+    changes survive an overload; the oldest message goes if all are states.
+
+    Messages of the priority types go to a separate lane with their enqueue
+    time instead, drained ahead of the other messages and never displaced by
+    them.
+    """
+
+    def __init__(self, maxsize=TCP_QUEUE_MAXSIZE, overflow=TCP_QUEUE_OVERFLOW,
+                 priority_types=PRIORITY_TYPES if STATE_PRIORITY_LANE else ()):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.priority_types = priority_types
+        self.dropped_count = 0
+        self._items = deque()
+        self._priority = deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+
+    def put(self, message):
+        with self._lock:
+            was_empty = not self._items and not self._priority
+            if self.priority_types and message.get("type") in self.priority_types:
+                if len(self._priority) == self.maxsize:
+                    self.dropped_count += 1
+                self._priority.append((time.perf_counter(), message))
+                return was_empty
+            if len(self._items) >= self.maxsize:
+                self.dropped_count += 1
+                if self.overflow == "drop_newest":
+                    return False
+                if self.overflow != "drop_non_state" or not self._drop_non_state():
+                    self._items.popleft()
+            self._items.append(message)
+            return was_empty
+
+    def _drop_non_state(self):
+        # State messages are rare, so this usually stops at the first item.
+        for index, item in enumerate(self._items):
+            if item.get("type") != "state":
+                del self._items[index]
+                return True
+        return False
+
+    def drain(self):
+        with self._lock:
+            items = list(self._items)
+            self._items.clear()
+            return items
+
+    def drain_priority(self):
+        """Take the priority lane as (perf_counter enqueue time, message) pairs."""
+        with self._lock:
+            items = list(self._priority)
+            self._priority.clear()
+            return items
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items) + len(self._priority)
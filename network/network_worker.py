@@ -0,0 +1,154 @@
+"""Network worker mode: socket reading, framing and decoding on a dedicated QThread."""
+
+import threading
+import time
+from PyQt6.QtCore import QObject, QThread, QMetaObject, QTimer, Qt, pyqtSignal, pyqtSlot
+from network.tcp_client import TCPClient
+from network.rtde_client import RTDEClient
+from network.message_queue import MessageQueue
+from config.settings import TCP_HOST, TCP_PORT, RTDE_PORT, TCP_PROTOCOL
+from utils.latency import LatencyStats
+
+# How often the worker publishes its client's counters for ThreadedTCPClient.stats().
+STATS_PUBLISH_INTERVAL_MS = 500
+
+
+def create_client(parent=None, host=TCP_HOST, port=None, queue=None):
+    """
+    Create the client for the configured TCP_PROTOCOL; port defaults to the protocol's port.
+    With a queue, the client hands its messages over through it (see TCPClient).
+    """
+    if TCP_PROTOCOL == "rtde":
+        return RTDEClient(parent, host, RTDE_PORT if port is None else port, queue=queue)
+    return TCPClient(parent, host, TCP_PORT if port is None else port, queue=queue)
+
+
+class NetworkWorker(QObject):
+    """
+    Owns a TCPClient or RTDEClient inside the network thread and feeds decoded messages into a MessageQueue.
+
+    The client's counters read its socket, so they are only collected on the
+    network thread and published as a lock-protected copy for other threads.
+    """
+    messages_available = pyqtSignal()
+    error_occurred = pyqtSignal(str)
+    connection_lost = pyqtSignal()
+    connection_state_changed = pyqtSignal(str)
+
+    def __init__(self, queue, host=TCP_HOST, port=None):
+        super().__init__()
+        self.queue = queue
+        self.host = host
+        self.port = port
+        self.client = None
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        self._stats_timer = None
+
+    @pyqtSlot()
+    def connect_to_robot(self):
+        # The client and its socket must be created in the thread that uses them.
+        if self.client is None:
+            self.client = create_client(self, self.host, self.port)
+            self.client.message_received.connect(self._enqueue)
+            self.client.error_occurred.connect(self.error_occurred)
+            self.client.connection_lost.connect(self.connection_lost)
+            self.client.connection_state_changed.connect(self.connection_state_changed)
+            self._stats_timer = QTimer(self)
+            self._stats_timer.timeout.connect(self.publish_stats)
+            self._stats_timer.start(STATS_PUBLISH_INTERVAL_MS)
+        self.client.connect_to_robot()
+
+    @pyqtSlot()
+    def disconnect_from_robot(self):
+        if self.client is not None:
+            self.client.disconnect_from_robot()
+            self.publish_stats()
+
+    def publish_stats(self):
+        stats = self.client.stats()
+        with self._stats_lock:
+            self._stats = stats
+
+    def stats(self):
+        """The client's counters as last published by the network thread; safe to call from any thread."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _enqueue(self, message):
+        if self.queue.put(message):
+            self.messages_available.emit()
+
+
+class ThreadedTCPClient(QObject):
+    """
+    GUI-side stand-in for TCPClient that runs the connection on a worker QThread.
+
+    Exposes the same signals and connect/disconnect methods as TCPClient;
+    message_received is emitted on the GUI thread when the queue is drained,
+    priority lane first. state_latency measures priority messages from being
+    queued to their message_received handlers having returned.
+    """
+    message_received = pyqtSignal(object)
+    error_occurred = pyqtSignal(str)
+    connection_lost = pyqtSignal()
+    connection_state_changed = pyqtSignal(str)
+
+    _connect_requested = pyqtSignal()
+    _disconnect_requested = pyqtSignal()
+
+    def __init__(self, parent=None, host=TCP_HOST, port=None):
+        super().__init__(parent)
+        self.queue = MessageQueue()
+        self.state_latency = LatencyStats()
+
+        self._thread = QThread()
+        self._thread.setObjectName("NetworkThread")
+        self._worker = NetworkWorker(self.queue, host, port)
+        self._worker.moveToThread(self._thread)
+        self._thread.finished.connect(self._worker.deleteLater)
+
+        self._connect_requested.connect(self._worker.connect_to_robot)
+        self._disconnect_requested.connect(self._worker.disconnect_from_robot)
+        self._worker.messages_available.connect(self._drain)
+        self._worker.error_occurred.connect(self.error_occurred)
+        self._worker.connection_lost.connect(self.connection_lost)
+        self._worker.connection_state_changed.connect(self.connection_state_changed)
+
+        self._thread.start()
+
+    def connect_to_robot(self):
+        """Ask the worker thread to connect; returns immediately."""
+        self._connect_requested.emit()
+
+    def disconnect_from_robot(self):
+        self._disconnect_requested.emit()
+
+    def stop(self):
+        """Disconnect and shut down the worker thread."""
+        if self._thread.isRunning():
+            # Wait for the disconnect, so the event loop cannot quit before it has run.
+            QMetaObject.invokeMethod(self._worker, "disconnect_from_robot", Qt.ConnectionType.BlockingQueuedConnection)
+        self._thread.quit()
+        self._thread.wait()
+
+    @property
+    def dropped_count(self):
+        return self.queue.dropped_count
+
+    def stats(self):
+        """Queue counters and the receive buffer and resync counters last published by the worker."""
+        # The worker is deleted once the thread has finished.
+        stats = self._worker.stats() if self._thread.isRunning() else {}
+        stats["messages_pending"] = len(self.queue)
+        stats["messages_dropped"] = self.queue.dropped_count
+        if self.queue.priority_types:
+            stats["state_latency"] = self.state_latency.summary()
+        return stats
+
+    def _drain(self):
+        for queued_at, message in self.queue.drain_priority():
+            self.message_received.emit(message)
+            self.state_latency.add(time.perf_counter() - queued_at)
+        for message in self.queue.drain():
+            self.message_received.emit(message)
@@ -0,0 +1,184 @@
+"""
+RTDE (Real-Time Data Exchange, port 30004) client for UR controllers.
+
+Subscribes to only the outputs the UI needs at a configurable frequency, so
+the controller does the decimation, and maps every data package onto the
+state, rotation and live stats messages UIController already understands.
+"""
+
+import struct
+from PyQt6.QtNetwork import QAbstractSocket
+from config.settings import (
+    TCP_HOST, RTDE_PORT, RTDE_FREQUENCY, TCP_TYPED_MESSAGES, RTDE_NOMINAL_PICK_RATE
+)
+from network.tcp_client import TCPClient
+from network.ur_realtime import STATE_NAMES, PROGRAM_STATE_PLAYING, derive_state_codes, rotation_from_joints
+from utils.enums import ConnectionState
+from utils.messages import as_message
+
+PROTOCOL_VERSION = 2
+
+HEADER = struct.Struct(">HB")
+COMMAND_REQUEST_PROTOCOL_VERSION = ord("V")
+COMMAND_TEXT_MESSAGE = ord("M")
+COMMAND_DATA_PACKAGE = ord("U")
+COMMAND_CONTROL_PACKAGE_SETUP_OUTPUTS = ord("O")
+COMMAND_CONTROL_PACKAGE_START = ord("S")
+COMMAND_CONTROL_PACKAGE_PAUSE = ord("P")
+
+# Struct codes of the RTDE data types.
+TYPE_FORMATS = {
+    "BOOL": "?",
+    "UINT8": "B",
+    "UINT32": "I",
+    "UINT64": "Q",
+    "INT32": "i",
+    "DOUBLE": "d",
+    "VECTOR3D": "3d",
+    "VECTOR6D": "6d",
+    "VECTOR6INT32": "6i",
+    "VECTOR6UINT32": "6I",
+}
+TYPE_SIZES = {"VECTOR3D": 3, "VECTOR6D": 6, "VECTOR6INT32": 6, "VECTOR6UINT32": 6}
+
+# runtime_state is needed on top of positions, safety status and speed scaling
+# to tell a running program from an idle robot.
+OUTPUTS = ("actual_q", "safety_status", "speed_scaling", "runtime_state")
+
+
+def pack_message(command, payload=b""):
+    return HEADER.pack(HEADER.size + len(payload), command) + payload
+
+
+def recipe_struct(types):
+    """Struct for a data package payload (after the recipe id) with the given RTDE types."""
+    return struct.Struct(">" + "".join(TYPE_FORMATS[name] for name in types))
+
+
+def unflatten(values, types):
+    """Group the flat values unpacked by recipe_struct() back into one value per output."""
+    result = []
+    index = 0
+    for name in types:
+        count = TYPE_SIZES.get(name, 1)
+        result.append(values[index] if count == 1 else values[index:index + count])
+        index += count
+    return result
+
+
+class RTDEClient(TCPClient):
+    """
+    TCPClient variant speaking RTDE.
+
+    Reuses the non-blocking connect and backoff of TCPClient; the connection
+    only counts as established once the output recipe is set up and the
+    controller has started streaming.
+    """
+
+    def __init__(self, parent=None, host=TCP_HOST, port=RTDE_PORT, frequency=RTDE_FREQUENCY, outputs=OUTPUTS, queue=None):
+        super().__init__(parent, host, port, queue)
+        self.frequency = frequency
+        self.outputs = tuple(outputs)
+        self.typed = TCP_TYPED_MESSAGES
+        self.package_count = 0
+
+        self._rtde_buffer = bytearray()
+        self._recipe_id = None
+        self._recipe = None
+        self._recipe_types = ()
+        self._streaming = False
+        self._last_state = None
+
+    def _on_connected(self):
+        # The connect timeout keeps running until the controller starts streaming.
+        self.reset_stream()
+        self._send(pack_message(COMMAND_REQUEST_PROTOCOL_VERSION, struct.pack(">H", PROTOCOL_VERSION)))
+
+    def reset_stream(self):
+        self._rtde_buffer.clear()
+        self._streaming = False
+        self._last_state = None
+
+    def _send(self, data):
+        # Replayed sessions feed the handshake replies without a live socket.
+        if self.socket.state() == QAbstractSocket.SocketState.ConnectedState:
+            self.socket.write(data)
+
+    def feed(self, data):
+        buffer = self._rtde_buffer
+        buffer += data
+
+        offset = 0
+        while len(buffer) - offset >= HEADER.size:
+            size, command = HEADER.unpack_from(buffer, offset)
+            if size < HEADER.size:
+                self.error_occurred.emit(f"Invalid RTDE package size {size}")
+                buffer.clear()
+                self._schedule_reconnect()
+                return
+            if len(buffer) - offset < size:
+                break
+            payload = bytes(buffer[offset + HEADER.size:offset + size])
+            offset += size
+            self._handle_package(command, payload)
+
+        if offset:
+            del buffer[:offset]
+
+    def _handle_package(self, command, payload):
+        if command == COMMAND_DATA_PACKAGE:
+            if self._streaming and payload and payload[0] == self._recipe_id:
+                self._handle_data(payload[1:])
+        elif command == COMMAND_REQUEST_PROTOCOL_VERSION:
+            if not payload or not payload[0]:
+                self._fail(f"RTDE protocol version {PROTOCOL_VERSION} not supported by controller")
+                return
+            setup = struct.pack(">d", self.frequency) + ",".join(self.outputs).encode()
+            self._send(pack_message(COMMAND_CONTROL_PACKAGE_SETUP_OUTPUTS, setup))
+        elif command == COMMAND_CONTROL_PACKAGE_SETUP_OUTPUTS:
+            self._recipe_id = payload[0]
+            types = payload[1:].decode(errors="replace").split(",")
+            missing = [name for name, kind in zip(self.outputs, types) if kind not in TYPE_FORMATS]
+            if missing or len(types) != len(self.outputs):
+                self._fail(f"RTDE outputs not available: {', '.join(missing) or payload[1:]!r}")
+                return
+            self._recipe_types = tuple(types)
+            self._recipe = recipe_struct(types)
+            self._send(pack_message(COMMAND_CONTROL_PACKAGE_START))
+        elif command == COMMAND_CONTROL_PACKAGE_START:
+            if not payload or not payload[0]:
+                self._fail("RTDE controller refused to start streaming")
+                return
+            self.connect_timeout_timer.stop()
+            self._streaming = True
+            self._reconnect_attempt = 0
+            self._set_state(ConnectionState.CONNECTED)
+            print(f"Connected to robot via RTDE at {self.frequency:g} Hz.")
+        elif command == COMMAND_TEXT_MESSAGE and payload:
+            print(f"[RTDE] {payload[1:1 + payload[0]].decode(errors='replace')}")
+
+    def _handle_data(self, data):
+        if len(data) != self._recipe.size:
+            self.error_occurred.emit(f"RTDE data package has {len(data)} bytes, expected {self._recipe.size}")
+            return
+        self.package_count += 1
+        values = dict(zip(self.outputs, unflatten(self._recipe.unpack(data), self._recipe_types)))
+
+        state = STATE_NAMES[int(derive_state_codes(
+            values["safety_status"], values["speed_scaling"], values["runtime_state"] == PROGRAM_STATE_PLAYING
+        ))]
+        if state != self._last_state:
+            self._last_state = state
+            self._emit({"type": "state", "state": state})
+
+        self._emit({"type": "rotation", "rotation": rotation_from_joints(values["actual_q"])})
+
+        if RTDE_NOMINAL_PICK_RATE is not None:
+            self._emit({"type": "liveStats", "currentSpeed": round(RTDE_NOMINAL_PICK_RATE * values["speed_scaling"])})
+
+    def _emit(self, message):
+        self._deliver(as_message(message) if self.typed else message)
+
+    def _fail(self, reason):
+        self.error_occurred.emit(reason)
+        self._schedule_reconnect()
@@ -1,69 +1,350 @@
+import math
+import os
+import selectors
 import serial
 import time
 from PyQt6.QtCore import QThread, pyqtSignal
-from config.settings import IMU_SERIAL_PORT, IMU_SERIAL_BAUDRATE, AXIS_SIGN, ROTATION_OFFSET
+from config.settings import (
+    IMU_SERIAL_PORT, IMU_SERIAL_BAUDRATE, IMU_DEVICES, IMU_PROTOCOL, AXIS_SIGN, ROTATION_OFFSET, ROTATION_THRESHOLD,
+    IMU_ROTATION_MODE, IMU_STATS_INTERVAL, ROTATION_FILTER, FRAME_INTERVAL_MS
+)
+from network.framing import LineFramer
+from network.imu_protocol import BinaryFrameParser, FRAME_ROTATION, FRAME_STATE
+from utils.rotation_filter import create_rotation_filter
+
+MAX_LINE_BYTES = 256
+IMU_PROTOCOLS = ("text", "binary", "auto")
+# State codes sent by the IMU (1 reduced speed, 2 normal, 3 stopped).
+STATE_CODES = {1, 2, 3}
+
+# Screen index of a device whose rotation applies to every screen.
+ALL_SCREENS = -1
+
+# Serial ports that cannot be waited on with select() (Windows) are polled this often.
+POLL_INTERVAL = 0.005
+
+
+def circular_mean(angles):
+    """Mean of angles in degrees, correct across the +/-180 wrap and in the range of the last angle."""
+    reference = angles[-1]
+    sin_sum = sum(math.sin(math.radians(angle - reference)) for angle in angles)
+    cos_sum = sum(math.cos(math.radians(angle - reference)) for angle in angles)
+    return reference + math.degrees(math.atan2(sin_sum, cos_sum))
+
+
+class ImuDevice:
+    """
+    Connection, parsing and per-frame rotation state of one IMU.
+
+    Data is either "r:<roll>" / "s:<state>" text lines or CRC-checked binary
+    frames (network/imu_protocol.py); in "auto" mode the first valid line or
+    frame of a connection picks the protocol.
+
+    At most one rotation per display frame is taken, carrying the latest or the
+    averaged sample (IMU_ROTATION_MODE); the rest are counted as dropped. That
+    value then passes the ROTATION_FILTER, and is only taken if it moved by
+    more than ROTATION_THRESHOLD, so noise does not restart rotation animations.
+    """
+
+    def __init__(self, port, screen=ALL_SCREENS, baudrate=IMU_SERIAL_BAUDRATE, mode=IMU_ROTATION_MODE,
+                 protocol=IMU_PROTOCOL, rotation_filter=ROTATION_FILTER, on_state=None):
+        if mode not in ("latest", "average"):
+            raise ValueError(f"Unknown IMU rotation mode: {mode}")
+        if protocol not in IMU_PROTOCOLS:
+            raise ValueError(f"Unknown IMU protocol: {protocol}")
+        self.port = port
+        self.screen = screen
+        self.baudrate = baudrate
+        self.mode = mode
+        self.protocol = protocol
+        self.on_state = on_state
+        self.serial = None
+        self.reconnect_at = 0.0
+        self.last_data_time = 0.0
+        self._last_state_emit_time = 0.0
+
+        self.sample_count = 0
+        self.emitted_count = 0
+        self.suppressed_count = 0
+        self.invalid_count = 0
+        self.samples_per_second = 0.0
+
+        self._framer = LineFramer(b'\n', MAX_LINE_BYTES)
+        self._binary = BinaryFrameParser()
+        self._active_protocol = None if protocol == "auto" else protocol
+        self._pending = []
+        self._filter = create_rotation_filter(rotation_filter)
+        self._last_rotation = None
+        self._last_rotation_emit = 0.0
+        self._rate_start = time.monotonic()
+        self._rate_samples = 0
+
+    @property
+    def dropped_count(self):
+        return self.sample_count - self.emitted_count - len(self._pending)
+
+    def stats(self):
+        return {
+            "screen": self.screen,
+            "samples_per_second": round(self.samples_per_second, 1),
+            "samples": self.sample_count,
+            "emitted": self.emitted_count,
+            "suppressed": self.suppressed_count,
+            "dropped": self.dropped_count,
+            "invalid": self.invalid_count,
+            "protocol": self._active_protocol,
+            **self._binary.stats(),
+        }
+
+    def open(self):
+        """Open the port without read timeout; raises serial.SerialException on failure."""
+        self.serial = serial.Serial(self.port, self.baudrate, timeout=0)
+        self._framer.clear()
+        self._binary.clear()
+        self._active_protocol = None if self.protocol == "auto" else self.protocol
+        if self._filter is not None:
+            self._filter.reset()
+        self.last_data_time = time.monotonic()
+        print(f"[IMU] Connected to {self.port}")
+
+    def close(self, reconnect_delay):
+        if self.serial is not None:
+            try:
+                self.serial.close()
+            except Exception:
+                pass
+            self.serial = None
+        self.reconnect_at = time.monotonic() + reconnect_delay
+
+    def fileno(self):
+        """File descriptor to wait on, or None if the port has to be polled."""
+        if os.name == "nt":
+            return None
+        try:
+            return self.serial.fileno()
+        except (AttributeError, OSError, serial.SerialException):
+            return None
+
+    def read(self):
+        """Read and parse everything waiting; returns True if it held any valid sample."""
+        data = self.serial.read(self.serial.in_waiting or 1)
+        if data and self.parse(data):
+            self.last_data_time = time.monotonic()  # Reset watchdog
+            return True
+        return False
+
+    def parse(self, data):
+        """Parse a batch of received bytes; returns True if it held any valid sample."""
+        if self._active_protocol == "binary":
+            return self._parse_frames(self._binary.feed(data))
+        if self._active_protocol == "text":
+            return self._parse_lines(self._framer.feed(data))
+
+        # Auto-detection: try both until one of them yields a valid sample.
+        if self._parse_frames(self._binary.feed(data)):
+            self._active_protocol = "binary"
+            self._framer.clear()
+        elif self._parse_lines(self._framer.feed(data)):
+            self._active_protocol = "text"
+            # Bytes skipped by the binary parser so far were text, not line noise.
+            self._binary = BinaryFrameParser()
+        else:
+            return False
+        print(f"[IMU] Detected {self._active_protocol} protocol on {self.port}")
+        return True
+
+    def _parse_frames(self, frames):
+        rolls = [value for frame_type, value in frames if frame_type == FRAME_ROTATION]
+        self._add_rotations(rolls)
+        if len(rolls) != len(frames):
+            for frame_type, value in frames:
+                if frame_type == FRAME_STATE:
+                    self._add_state(value)
+        return bool(frames)
+
+    def _parse_lines(self, lines):
+        valid = False
+        rolls = []
+        for raw in lines:
+            line = raw.decode(errors="ignore").strip()
+            if not line or ':' not in line:
+                continue
+
+            prefix, value = line.split(':', 1)
+            prefix = prefix.strip().lower()
+
+            if prefix == 'r':
+                try:
+                    roll = float(value)
+                except ValueError:
+                    self.invalid_count += 1
+                    continue
+                # float() accepts "nan" and "inf", which must not count as a valid line.
+                if not math.isfinite(roll):
+                    self.invalid_count += 1
+                    continue
+                rolls.append(roll)
+                valid = True
+            elif prefix == 's':
+                try:
+                    state = int(value)
+                except ValueError:
+                    self.invalid_count += 1
+                    continue
+                if state not in STATE_CODES:
+                    self.invalid_count += 1
+                    continue
+                self._add_state(state)
+                valid = True
+        self._add_rotations(rolls)
+        return valid
+
+    def _add_rotations(self, rolls):
+        samples = [AXIS_SIGN * roll + ROTATION_OFFSET for roll in rolls if math.isfinite(roll)]
+        self.invalid_count += len(rolls) - len(samples)
+        self.sample_count += len(samples)
+        self._pending.extend(samples)
+
+    def _add_state(self, state):
+        if state in STATE_CODES:
+            current_time = time.time()
+            if current_time - self._last_state_emit_time >= 0.9:
+                self._last_state_emit_time = current_time
+                if self.on_state is not None:
+                    self.on_state(state)
+
+    def take_rotation(self, now, interval):
+        """The rotation to emit for this frame, or None if there is nothing (new) to show."""
+        if not self._pending or now - self._last_rotation_emit < interval:
+            return None
+        rotation = self._pending[-1] if self.mode == "latest" else circular_mean(self._pending)
+        self._pending.clear()
+        self._last_rotation_emit = now
+        if self._filter is not None:
+            rotation = self._filter.update(rotation, now)
+        if self._last_rotation is not None and abs(rotation - self._last_rotation) <= ROTATION_THRESHOLD:
+            self.suppressed_count += 1
+            return None
+        self._last_rotation = rotation
+        self.emitted_count += 1
+        return rotation
+
+    def update_rate(self, now):
+        elapsed = now - self._rate_start
+        if elapsed >= 1.0:
+            self.samples_per_second = (self.sample_count - self._rate_samples) / elapsed
+            self._rate_start = now
+            self._rate_samples = self.sample_count
+
+
+def configured_devices():
+    """(port, screen index) pairs from IMU_DEVICES, or the single IMU_SERIAL_PORT for all screens."""
+    if IMU_DEVICES:
+        return [tuple(device) for device in IMU_DEVICES]
+    return [(IMU_SERIAL_PORT, ALL_SCREENS)]
+
 
 class SerialReader(QThread):
-    rotation_received = pyqtSignal(float)
+    """
+    Reads one or more IMUs (see ImuDevice) from a single background thread.
+
+    Open ports are waited on together with a selector where the platform
+    allows it and polled otherwise; each device reconnects on its own after
+    errors or a watchdog timeout. Rotations are emitted with the screen index
+    of their device (ALL_SCREENS for every screen).
+    """
+    rotation_received = pyqtSignal(float, int)
     state_received = pyqtSignal(int)
 
-    def __init__(self, port=IMU_SERIAL_PORT, baudrate=IMU_SERIAL_BAUDRATE):
+    def __init__(self, devices=None, baudrate=IMU_SERIAL_BAUDRATE, mode=IMU_ROTATION_MODE,
+                 protocol=IMU_PROTOCOL, rotation_filter=ROTATION_FILTER):
         super().__init__()
-        self.port = port
-        self.baudrate = baudrate
+        self.devices = [
+            ImuDevice(port, screen, baudrate, mode, protocol, rotation_filter, self.state_received.emit)
+            for port, screen in (devices or configured_devices())
+        ]
         self.running = True
-        self.reconnect_delay = 2 
+        self.reconnect_delay = 2
         self.watchdog_timeout = 0.5
-        self._last_state_emit_time = 0.0
+        self.emit_interval = FRAME_INTERVAL_MS / 1000
+        self._selector = None
+        self._polled = []
+        self._last_stats_print = time.monotonic()
+
+    def stats(self):
+        return {device.port: device.stats() for device in self.devices}
 
     def run(self):
-        while self.running:
+        self._selector = selectors.DefaultSelector()
+        try:
+            while self.running:
+                now = time.monotonic()
+                for device in self.devices:
+                    if device.serial is None:
+                        if now >= device.reconnect_at:
+                            self._open(device)
+                    elif now - device.last_data_time > self.watchdog_timeout:
+                        print(f"[IMU] Watchdog timeout on {device.port}: no data received in {self.watchdog_timeout} seconds. Reconnecting...")
+                        self._close(device)
+
+                self._wait_and_read()
+
+                now = time.monotonic()
+                for device in self.devices:
+                    rotation = device.take_rotation(now, self.emit_interval)
+                    if rotation is not None:
+                        self.rotation_received.emit(rotation, device.screen)
+                    device.update_rate(now)
+
+                if IMU_STATS_INTERVAL and now - self._last_stats_print >= IMU_STATS_INTERVAL:
+                    self._last_stats_print = now
+                    print(f"[IMU] {self.stats()}")
+        finally:
+            for device in self.devices:
+                if device.serial is not None:
+                    self._close(device)
+            self._selector.close()
+
+    def _wait_and_read(self):
+        # The wait doubles as the frame tick for flushing held-back samples.
+        timeout = POLL_INTERVAL if self._polled else self.emit_interval
+        if self._selector.get_map():
+            ready = [key.data for key, _ in self._selector.select(timeout)]
+        else:
+            time.sleep(timeout)
+            ready = []
+        ready += [device for device in self._polled if device.serial is not None and device.serial.in_waiting]
+
+        for device in ready:
+            try:
+                device.read()
+            except Exception as e:
+                print(f"[IMU] Read error on {device.port}: {e}")
+                self._close(device)
+
+    def _open(self, device):
+        try:
+            device.open()
+        except serial.SerialException as e:
+            print(f"[IMU] Serial error: {e}")
+            print(f"[IMU] Reattempting connection to {device.port} in {self.reconnect_delay} seconds...")
+            device.close(self.reconnect_delay)
+            return
+        fd = device.fileno()
+        if fd is None:
+            self._polled.append(device)
+        else:
+            self._selector.register(fd, selectors.EVENT_READ, device)
+
+    def _close(self, device):
+        if device in self._polled:
+            self._polled.remove(device)
+        else:
             try:
-                with serial.Serial(self.port, self.baudrate, timeout=1) as ser:
-                    print(f"[IMU] Connected to {self.port}")
-                    last_data_time = time.time()
-
-                    while self.running:
-                        if time.time() - last_data_time > self.watchdog_timeout:
-                            print("[IMU] Watchdog timeout: no data received in 10 seconds. Reconnecting...")
-                            raise serial.SerialException("Watchdog timeout")
-
-                        try:
-                            line = ser.readline().decode(errors="ignore").strip()
-                        except Exception as e:
-                            print(f"[IMU] Read error: {e}")
-                            break
-
-                        if not line or ':' not in line:
-                            continue
-
-                        last_data_time = time.time()  # Reset watchdog
-
-                        prefix, value = line.split(':', 1)
-                        prefix = prefix.strip().lower()
-                        value = value.strip()
-
-                        if prefix == 'r':
-                            try:
-                                roll = float(value)
-                                self.rotation_received.emit(AXIS_SIGN * roll + ROTATION_OFFSET)
-                            except ValueError:
-                                continue
-                        elif prefix == 's':
-                            try:
-                                state = int(value)
-                                if state in {1, 2, 3}:
-                                    current_time = time.time()
-                                    if current_time - self._last_state_emit_time >= 0.9:
-                                        self._last_state_emit_time = current_time
-                                        self.state_received.emit(state)
-                            except ValueError:
-                                continue
-
-            except serial.SerialException as e:
-                print(f"[IMU] Serial error: {e}")
-                print(f"[IMU] Reattempting connection in {self.reconnect_delay} seconds...")
-                time.sleep(self.reconnect_delay)
+                self._selector.unregister(device.serial.fileno())
+            except (KeyError, ValueError, OSError, AttributeError):
+                pass
+        device.close(self.reconnect_delay)
 
     def stop(self):
         self.running = False
@@ -0,0 +1,109 @@
+"""
+Compressed, append-only session log of everything received from the robot.
+
+Each record is a little-endian (kind, monotonic ns, length) header followed by
+the payload: a JSON metadata blob when a session starts, the raw bytes of
+every socket read afterwards and an empty marker for every disconnect. The file is a gzip stream; every session is
+appended as a new gzip member, so logs can be concatenated and a log cut off
+by a crash stays readable up to the last flush.
+"""
+
+import atexit
+import gzip
+import json
+import queue
+import struct
+import threading
+import time
+import zlib
+
+RECORD_HEADER = struct.Struct("<BQI")
+KIND_SESSION_START = 0
+KIND_DATA = 1
+KIND_DISCONNECT = 2
+
+FLUSH_INTERVAL = 1.0
+
+
+class SessionRecorder:
+    """
+    Records received data from any thread; compression and file I/O happen on a background writer thread.
+    """
+
+    def __init__(self, path, metadata=None, compresslevel=6):
+        self.path = path
+        self.compresslevel = compresslevel
+        self.dropped_count = 0
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+
+        start = dict(metadata or {}, wall_time=time.time())
+        self._queue.put((KIND_SESSION_START, time.monotonic_ns(), json.dumps(start).encode()))
+
+        self._thread = threading.Thread(target=self._run, name="SessionRecorder", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, data):
+        """Queue one chunk of received bytes; never blocks on disk."""
+        if self._closed:
+            self.dropped_count += 1
+            return
+        self._queue.put((KIND_DATA, time.monotonic_ns(), bytes(data)))
+
+    def record_disconnect(self):
+        """Mark the end of a connection, so a replay drops partial frames at the same point."""
+        if not self._closed:
+            self._queue.put((KIND_DISCONNECT, time.monotonic_ns(), b""))
+
+    def close(self):
+        """Flush everything queued so far and stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        with gzip.open(self.path, "ab", compresslevel=self.compresslevel) as log:
+            last_flush = time.monotonic()
+            dirty = False
+            while True:
+                try:
+                    item = self._queue.get(timeout=FLUSH_INTERVAL)
+                except queue.Empty:
+                    item = ()
+                if item is None:
+                    break
+                if item:
+                    kind, timestamp, payload = item
+                    log.write(RECORD_HEADER.pack(kind, timestamp, len(payload)))
+                    log.write(payload)
+                    dirty = True
+
+                now = time.monotonic()
+                if dirty and now - last_flush >= FLUSH_INTERVAL:
+                    # A sync flush makes everything written so far readable after a crash.
+                    log.flush(zlib.Z_SYNC_FLUSH)
+                    last_flush = now
+                    dirty = False
+
+
+def read_session_log(path):
+    """
+    Yield (kind, monotonic ns, payload) records from a session log.
+    Stops quietly at a truncated tail, e.g. from a log that was still being written.
+    """
+    with gzip.open(path, "rb") as log:
+        while True:
+            try:
+                header = log.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    return
+                kind, timestamp, length = RECORD_HEADER.unpack(header)
+                payload = log.read(length)
+            except (EOFError, zlib.error, gzip.BadGzipFile):
+                return
+            if len(payload) < length:
+                return
+            yield kind, timestamp, payload
@@ -0,0 +1,89 @@
+"""
+Feeds a recorded session log back through a client's normal receive path.
+"""
+
+import json
+import time
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from network.session_recorder import KIND_SESSION_START, KIND_DATA, KIND_DISCONNECT, read_session_log
+
+# Without pacing, records are fed in slices of this many ms so the event loop keeps running.
+FAST_SLICE_MS = 5
+
+
+class SessionReplayer(QObject):
+    """
+    Replays a session log into client.feed() with the recorded timing scaled by
+    speed (1.0 = real time); a speed of 0 replays as fast as possible.
+    """
+    session_started = pyqtSignal(dict)
+    finished = pyqtSignal()
+
+    def __init__(self, client, path, speed=1.0, parent=None):
+        super().__init__(parent)
+        self.client = client
+        self.path = path
+        self.speed = speed
+        self.record_count = 0
+        self.byte_count = 0
+        self.max_lag_ms = 0.0
+
+        self._records = None
+        self._next = None
+        self._log_origin = 0
+        self._wall_origin = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._step)
+
+    def start(self):
+        self._records = read_session_log(self.path)
+        self._next = next(self._records, None)
+        self._rebase()
+        self._timer.start(0)
+
+    def stop(self):
+        self._timer.stop()
+        self._records = None
+
+    def _rebase(self):
+        """Align the next record with the current wall clock."""
+        if self._next is not None:
+            self._log_origin = self._next[1]
+            self._wall_origin = time.perf_counter_ns()
+
+    def _step(self):
+        slice_end = time.perf_counter_ns() + FAST_SLICE_MS * 1_000_000
+        while self._next is not None:
+            kind, timestamp, payload = self._next
+            now = time.perf_counter_ns()
+            if self.speed > 0:
+                due = self._wall_origin + (timestamp - self._log_origin) / self.speed
+                if due > now:
+                    self._timer.start(int((due - now) // 1_000_000))
+                    return
+                self.max_lag_ms = max(self.max_lag_ms, (now - due) / 1_000_000)
+            elif now > slice_end:
+                self._timer.start(0)
+                return
+
+            self._replay(kind, payload)
+            self._next = next(self._records, None) if self._records is not None else None
+            if kind == KIND_SESSION_START:
+                # Monotonic timestamps of separate recording sessions are unrelated.
+                self._rebase()
+
+        self.finished.emit()
+
+    def _replay(self, kind, payload):
+        self.record_count += 1
+        if kind == KIND_DATA:
+            self.byte_count += len(payload)
+            self.client.feed(payload)
+        elif kind == KIND_DISCONNECT:
+            self.client.reset_stream()
+        elif kind == KIND_SESSION_START:
+            self.client.reset_stream()
+            self.session_started.emit(json.loads(payload))
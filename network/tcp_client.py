@@ -1,89 +1,210 @@
 import json
+import random
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 from PyQt6.QtNetwork import QTcpSocket, QAbstractSocket
-from config.settings import TCP_HOST, TCP_PORT, TCP_MESSAGE_DELIMITER   
+from config.settings import (
+    TCP_HOST, TCP_PORT, TCP_PROTOCOL, TCP_MESSAGE_DELIMITER, TCP_CONNECT_TIMEOUT,
+    TCP_RECONNECT_INITIAL, TCP_RECONNECT_MAX, TCP_RECONNECT_JITTER, TCP_MAX_FRAME_BYTES,
+    TCP_READ_BUFFER_BYTES, SESSION_RECORDING_PATH
+)
+from network.framing import LineFramer
+from network.message_decoder import MessageDecoder
+from network.session_recorder import SessionRecorder
+from network.ur_realtime import RealtimeDecoder
+from utils.enums import ConnectionState
 
-RECONNECT_INTERVAL = 5000
 
 class TCPClient(QObject):
-    message_received = pyqtSignal(dict)
+    """
+    Robot connection with reconnects, framing and decoding.
+
+    With a MessageQueue, decoded messages are queued and emitted in batches
+    from one posted drain call instead of one queued signal each, so
+    TCP_QUEUE_MAXSIZE and TCP_QUEUE_OVERFLOW bound the backlog of a GUI
+    thread that falls behind also without TCP_WORKER_THREAD.
+    """
+    message_received = pyqtSignal(object)
     error_occurred = pyqtSignal(str)
     connection_lost = pyqtSignal()
+    connection_state_changed = pyqtSignal(str)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, host=TCP_HOST, port=TCP_PORT, queue=None):
         super().__init__(parent)
+        self.host = host
+        self.port = port
+        self.queue = queue
         self.socket = QTcpSocket(self)
+        # Bounds Qt's own buffer; once full the socket stops reading and TCP pushes back on the peer.
+        self.socket.setReadBufferSize(TCP_READ_BUFFER_BYTES)
         self.socket.readyRead.connect(self._on_ready_read)
         self.socket.errorOccurred.connect(self._on_error)
+        self.socket.connected.connect(self._on_connected)
         self.socket.disconnected.connect(self._on_disconnected)
 
-        self._buffer = bytearray()
-        
+        self._framer = LineFramer(TCP_MESSAGE_DELIMITER, TCP_MAX_FRAME_BYTES)
+        self._decoder = MessageDecoder()
+        self._realtime = RealtimeDecoder(on_error=self.error_occurred.emit) if TCP_PROTOCOL == "ur_realtime" else None
+
+        self.state = ConnectionState.DISCONNECTED
+        self._should_connect = False
+        self._reconnect_attempt = 0
+        self.recorder = None
+
+        self.connect_timeout_timer = QTimer(self)
+        self.connect_timeout_timer.setSingleShot(True)
+        self.connect_timeout_timer.setInterval(TCP_CONNECT_TIMEOUT)
+        self.connect_timeout_timer.timeout.connect(self._on_connect_timeout)
+
         self.reconnect_timer = QTimer(self)
-        self.reconnect_timer.setInterval(RECONNECT_INTERVAL)
+        self.reconnect_timer.setSingleShot(True)
         self.reconnect_timer.timeout.connect(self._attempt_reconnect)
 
     def connect_to_robot(self):
-        """Connect to the TCP host using parameters from config.settings."""
-        self.socket.connectToHost(TCP_HOST, TCP_PORT)
-        if not self.socket.waitForConnected(3000):
-            self.error_occurred.emit(f"Connection failed: {self.socket.errorString()}")
-            self._start_reconnect_attempts()
-        else:
-            print("Connected to robot.")
+        """Start connecting to the configured host; returns immediately."""
+        self._should_connect = True
+        self._reconnect_attempt = 0
+        if SESSION_RECORDING_PATH and self.recorder is None:
+            self.recorder = SessionRecorder(SESSION_RECORDING_PATH, {
+                "protocol": TCP_PROTOCOL,
+                "host": self.host,
+                "port": self.port,
+            })
+        self.reconnect_timer.stop()
+        self._attempt_reconnect()
 
     def _on_ready_read(self):
-        """Handle incoming data as \r-separated JSON messages with proper buffer management."""
-        self._buffer += self.socket.readAll().data()
-        
-        while True:
-
-            pos = self._buffer.find(TCP_MESSAGE_DELIMITER)
-            if pos == -1:
-                break
-                
-            msg_bytes = self._buffer[:pos]
-            self._buffer = self._buffer[pos+1:]
-            
+        data = self.socket.readAll().data()
+        if self.recorder is not None:
+            self.recorder.record(data)
+        self.feed(data)
+
+    def feed(self, data):
+        """Handle received bytes as delimiter-separated JSON messages or real-time packets."""
+        if self._realtime is not None:
+            for message in self._realtime.feed(data):
+                self._deliver(message)
+            return
+
+        resyncs = self._framer.resync_count
+        frames = self._framer.feed(data)
+        if self._framer.resync_count != resyncs:
+            self.error_occurred.emit(
+                f"Message exceeded {TCP_MAX_FRAME_BYTES} bytes without a delimiter; resyncing at the next one"
+            )
+
+        for msg_bytes in frames:
             try:
-                message = json.loads(msg_bytes.decode('utf-8'))
-                self.message_received.emit(message)
+                message = self._decoder.decode(msg_bytes)
+                self._deliver(message)
             except UnicodeDecodeError:
                 self.error_occurred.emit(f"Invalid UTF-8 in message: {msg_bytes}")
             except json.JSONDecodeError as e:
                 self.error_occurred.emit(f"Invalid JSON: {e.doc} | Error: {str(e)}")
+            except ValueError as e:
+                self.error_occurred.emit(f"Invalid message: {msg_bytes} | Error: {str(e)}")
+
+    def _deliver(self, message):
+        if self.queue is None:
+            self.message_received.emit(message)
+        elif self.queue.put(message):
+            QTimer.singleShot(0, self._drain)
 
+    def _drain(self):
+        for _, message in self.queue.drain_priority():
+            self.message_received.emit(message)
+        for message in self.queue.drain():
+            self.message_received.emit(message)
 
     def disconnect_from_robot(self):
         """Disconnect and stop reconnection attempts."""
+        self._should_connect = False
+        self.reconnect_timer.stop()
+        self.connect_timeout_timer.stop()
         if self.socket.state() == QAbstractSocket.SocketState.ConnectedState:
             self.socket.disconnectFromHost()
-            self.socket.waitForDisconnected(3000)
+            if self.socket.state() != QAbstractSocket.SocketState.UnconnectedState:
+                self.socket.waitForDisconnected(3000)
             print("Disconnected from robot.")
-        self.reconnect_timer.stop()
+        else:
+            self.socket.abort()
+        self._set_state(ConnectionState.DISCONNECTED)
+
+    def _set_state(self, state):
+        if state != self.state:
+            self.state = state
+            self.connection_state_changed.emit(state.value)
+
+    def _on_connected(self):
+        self.connect_timeout_timer.stop()
+        self._reconnect_attempt = 0
+        self._set_state(ConnectionState.CONNECTED)
+        print("Connected to robot.")
+
+    def stats(self):
+        """Receive buffer, resync and, with a queue, queue counters."""
+        buffered = self.socket.bytesAvailable() + len(self._framer)
+        resyncs = self._framer.resync_count
+        if self._realtime is not None:
+            buffered += len(self._realtime)
+            resyncs += self._realtime.resync_count
+        stats = {
+            "bytes_buffered": buffered,
+            "bytes_discarded": self._framer.discarded_bytes,
+            "resyncs": resyncs,
+        }
+        if self.queue is not None:
+            stats["messages_pending"] = len(self.queue)
+            stats["messages_dropped"] = self.queue.dropped_count
+        return stats
+
+    def reset_stream(self):
+        """Drop partially received data at the end of a connection."""
+        self._framer.clear()
+        if self._realtime is not None:
+            self._realtime.reset()
 
     def _on_disconnected(self):
         """Handle unexpected disconnections."""
-        self.error_occurred.emit("Connection lost. Attempting to reconnect...")
-        self.connection_lost.emit()
-        self._start_reconnect_attempts()
+        self.reset_stream()
+        if self.recorder is not None:
+            self.recorder.record_disconnect()
+        if self._should_connect:
+            self._schedule_reconnect()
 
-    def _start_reconnect_attempts(self):
-        """Start the reconnection timer if it’s not already active."""
-        if not self.reconnect_timer.isActive():
-            self.reconnect_timer.start()
+    def _on_connect_timeout(self):
+        self.error_occurred.emit(f"Connection attempt timed out after {TCP_CONNECT_TIMEOUT} ms")
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self):
+        """Abort the current attempt and retry after an exponential, jittered backoff."""
+        if not self._should_connect or self.state == ConnectionState.BACKOFF:
+            return
+        if self.state == ConnectionState.CONNECTED:
+            self.error_occurred.emit("Connection lost. Attempting to reconnect...")
+            self.connection_lost.emit()
+        # Set the state first: abort() can re-enter through the disconnected signal.
+        self._set_state(ConnectionState.BACKOFF)
+        self.connect_timeout_timer.stop()
+        self.socket.abort()
+
+        delay = min(TCP_RECONNECT_MAX, TCP_RECONNECT_INITIAL * 2 ** min(self._reconnect_attempt, 16))
+        delay *= 1 + random.uniform(-TCP_RECONNECT_JITTER, TCP_RECONNECT_JITTER)
+        self._reconnect_attempt += 1
+        self.reconnect_timer.start(int(delay))
 
     def _attempt_reconnect(self):
-        """Try to reconnect if not currently connected."""
+        """Start a non-blocking connection attempt."""
         if self.socket.state() == QAbstractSocket.SocketState.ConnectedState:
-            self.reconnect_timer.stop()
-            print("Connected to Robot!")
+            self._set_state(ConnectionState.CONNECTED)
             return
-        print("Attempting to reconnect...")
+        self._set_state(ConnectionState.CONNECTING)
         self.socket.abort()
-        self.socket.connectToHost(TCP_HOST, TCP_PORT)
+        self.socket.connectToHost(self.host, self.port)
+        self.connect_timeout_timer.start()
 
     def _on_error(self, socket_error):
         """Handle socket errors and trigger reconnection attempts."""
+        if self.state == ConnectionState.BACKOFF:
+            return
         self.error_occurred.emit(f"Socket error: {self.socket.errorString()}")
-        self._start_reconnect_attempts()
\ No newline at end of file
+        self._schedule_reconnect()
@@ -0,0 +1,202 @@
+"""
+Decoder for the UR real-time client interface (port 30003).
+
+The controller streams fixed-layout, big-endian binary packets at 500 Hz.
+Each packet starts with its total size as an int32, followed by doubles at
+fixed offsets. Complete packets are decoded in bulk with a NumPy structured
+dtype and turned into the state and rotation messages UIController already
+understands; rotation is decimated to the display frame rate.
+"""
+
+import math
+import struct
+import numpy as np
+from config.settings import (
+    FRAME_INTERVAL_MS, TCP_TYPED_MESSAGES,
+    UR_ROTATION_JOINT, UR_ROTATION_SIGN, UR_ROTATION_OFFSET,
+    UR_REDUCED_SPEED_SCALING, UR_STOPPED_SPEED_SCALING
+)
+from utils.messages import as_message
+
+HEADER = struct.Struct(">i")
+
+# Byte offsets of the fields we use, valid for CB3 3.x and e-Series 5.x.
+FIELD_OFFSETS = {
+    "time": (4, ">f8"),
+    "q_actual": (252, (">f8", (6,))),
+    "robot_mode": (756, ">f8"),
+    "safety_mode": (812, ">f8"),
+    "speed_scaling": (940, ">f8"),
+    "program_state": (1052, ">f8"),
+}
+MIN_PACKET_SIZE = 1060
+MAX_PACKET_SIZE = 4096
+
+ROBOT_MODE_RUNNING = 7
+PROGRAM_STATE_PLAYING = 2
+SAFETY_MODE_REDUCED = 2
+SAFETY_MODES_STOPPED = {3, 5, 6, 7, 12, 13}
+SAFETY_MODES_ERROR = {8, 9}
+
+STATE_NAMES = ("normal", "reduced_speed", "stopped", "error", "idle")
+
+
+def packet_dtype(size):
+    """Structured dtype covering one packet of the given size."""
+    return np.dtype({
+        "names": list(FIELD_OFFSETS),
+        "formats": [fmt for _, fmt in FIELD_OFFSETS.values()],
+        "offsets": [offset for offset, _ in FIELD_OFFSETS.values()],
+        "itemsize": size,
+    })
+
+
+def derive_state_codes(safety_mode, speed_scaling, running):
+    """Map safety mode, speed scaling and program activity arrays onto indices into STATE_NAMES."""
+    safety_mode = np.asarray(safety_mode).astype(np.int64)
+    speed_scaling = np.asarray(speed_scaling)
+    running = np.asarray(running)
+
+    return np.select(
+        [
+            np.isin(safety_mode, list(SAFETY_MODES_STOPPED)),
+            np.isin(safety_mode, list(SAFETY_MODES_ERROR)),
+            ~running,
+            speed_scaling <= UR_STOPPED_SPEED_SCALING,
+            (safety_mode == SAFETY_MODE_REDUCED) | (speed_scaling < UR_REDUCED_SPEED_SCALING),
+        ],
+        [2, 3, 4, 2, 1],
+        default=0,
+    )
+
+
+def rotation_from_joints(q):
+    """UI rotation in degrees for a vector of joint positions in radians."""
+    return UR_ROTATION_SIGN * math.degrees(q[UR_ROTATION_JOINT]) + UR_ROTATION_OFFSET
+
+
+class RealtimeDecoder:
+    """
+    Incremental decoder for the real-time byte stream.
+
+    feed() returns the messages derived from all packets completed by the new
+    data: one state message per state change and at most one rotation
+    message per display frame of robot time.
+    """
+
+    def __init__(self, on_error=None, typed=TCP_TYPED_MESSAGES, frame_interval=FRAME_INTERVAL_MS / 1000):
+        self.on_error = on_error
+        self.typed = typed
+        self.frame_interval = frame_interval
+        self.packet_size = None
+        self.packet_count = 0
+        self.resync_count = 0
+
+        self._buffer = bytearray()
+        self._dtype = None
+        self._resyncing = False
+        self._last_state = None
+        self._last_rotation_time = None
+
+    def feed(self, data):
+        buffer = self._buffer
+        buffer += data
+
+        offset = 0
+        chunks = []
+        while len(buffer) - offset >= HEADER.size:
+            size = HEADER.unpack_from(buffer, offset)[0]
+            if not MIN_PACKET_SIZE <= size <= MAX_PACKET_SIZE or \
+                    (self.packet_size is not None and size != self.packet_size):
+                offset = self._resync(offset, f"Invalid real-time packet size {size}")
+                continue
+
+            if self.packet_size is None:
+                # Only trust a size once the following packet starts with the same header.
+                if len(buffer) - offset < size + HEADER.size:
+                    break
+                if HEADER.unpack_from(buffer, offset + size)[0] != size:
+                    offset = self._resync(offset, f"Unconfirmed real-time packet size {size}")
+                    continue
+                self.packet_size = size
+
+            # Take every consecutive complete packet as one chunk.
+            start = offset
+            while len(buffer) - offset >= size and HEADER.unpack_from(buffer, offset)[0] == size:
+                offset += size
+            if offset == start:
+                break
+            chunks.append(bytes(buffer[start:offset]))
+            self._resyncing = False
+
+        if offset:
+            del buffer[:offset]
+
+        messages = []
+        for chunk in chunks:
+            messages.extend(self._decode_chunk(chunk))
+        return messages
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def reset(self):
+        """Drop buffered bytes and derived state, e.g. after a reconnect."""
+        self._buffer.clear()
+        self._resyncing = False
+        self._last_state = None
+        self._last_rotation_time = None
+
+    def _resync(self, offset, reason):
+        """Skip ahead to the next plausible packet header; reports once per resync episode."""
+        if not self._resyncing:
+            self._resyncing = True
+            self.resync_count += 1
+            if self.on_error is not None:
+                self.on_error(reason)
+        if self.packet_size is not None:
+            pos = self._buffer.find(HEADER.pack(self.packet_size), offset + 1)
+            if pos != -1:
+                return pos
+            # Keep a possibly split header at the end of the buffer.
+            return max(offset + 1, len(self._buffer) - HEADER.size + 1)
+        return offset + 1
+
+    def _decode_chunk(self, chunk):
+        if self._dtype is None or self._dtype.itemsize != self.packet_size:
+            self._dtype = packet_dtype(self.packet_size)
+        records = np.frombuffer(chunk, dtype=self._dtype)
+        self.packet_count += len(records)
+
+        messages = []
+        running = (records["robot_mode"].astype(np.int64) == ROBOT_MODE_RUNNING) & \
+            (records["program_state"].astype(np.int64) == PROGRAM_STATE_PLAYING)
+        codes = derive_state_codes(records["safety_mode"], records["speed_scaling"], running)
+        changes = np.flatnonzero(np.diff(codes, prepend=-1 if self._last_state is None else self._last_state))
+        for index in changes:
+            messages.append(self._message({"type": "state", "state": STATE_NAMES[codes[index]]}))
+        self._last_state = int(codes[-1])
+
+        latest = records[-1]
+        if self._last_rotation_time is None or latest["time"] - self._last_rotation_time >= self.frame_interval:
+            self._last_rotation_time = float(latest["time"])
+            messages.append(self._message({"type": "rotation", "rotation": rotation_from_joints(latest["q_actual"])}))
+        return messages
+
+    def _message(self, message):
+        return as_message(message) if self.typed else message
+
+
+def encode_packet(time, q_actual=(0.0,) * 6, robot_mode=ROBOT_MODE_RUNNING, safety_mode=1,
+                  speed_scaling=1.0, program_state=PROGRAM_STATE_PLAYING, size=1116):
+    """Build a real-time packet with the given field values and all others zero."""
+    record = np.zeros(1, dtype=packet_dtype(size))
+    record["time"] = time
+    record["q_actual"] = q_actual
+    record["robot_mode"] = robot_mode
+    record["safety_mode"] = safety_mode
+    record["speed_scaling"] = speed_scaling
+    record["program_state"] = program_state
+    packet = bytearray(record.tobytes())
+    HEADER.pack_into(packet, 0, size)
+    return bytes(packet)
@@ -0,0 +1,185 @@
+"""
+IMU emulator on a pseudo-terminal, so SerialReader can run without the device.
+
+Creates a pty, prints the path of its slave end (set IMU_SERIAL_PORT to it) and
+streams roll and state samples in the text or binary IMU protocol at
+configurable rates, with noise, corrupted bytes and periodic dropouts that
+exercise the SerialReader watchdog and reconnect path. POSIX only; on
+Windows use a virtual COM port pair instead.
+
+Run from the repository root:
+    python -m tools.imu_emulator --rate 500 --noise 0.3 --protocol binary --dropout-every 10
+"""
+
+import argparse
+import math
+import os
+import random
+import threading
+import time
+
+from network.imu_protocol import encode_frame, FRAME_ROTATION, FRAME_STATE
+
+STATE_CYCLE = (2, 1, 2, 3)
+
+# Sequence pattern rolls count up modulo this, exactly representable in float32 and text.
+SEQUENCE_MODULO = 100000
+
+
+class ImuEmulator:
+    """Streams synthetic IMU data into a pty from a background thread; use start()/stop()."""
+    TICK = 0.001
+
+    def __init__(self, config):
+        # POSIX only, imported here so the module still loads on Windows.
+        import pty
+        import tty
+
+        self.config = config
+        self.master, self._slave = pty.openpty()
+        tty.setraw(self._slave)
+        # Keep our own slave fd open so writes don't fail while the reader reconnects,
+        # and never block: a full pty buffer drops bytes like a UART overrun.
+        os.set_blocking(self.master, False)
+        self.slave_path = os.ttyname(self._slave)
+
+        self.sequence = 0
+        self.sent_times = {}
+        self.resume_times = []
+        self.counters = {}
+        self.stopping = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="ImuEmulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+        os.close(self.master)
+        os.close(self._slave)
+
+    def _roll(self, t):
+        config = self.config
+        if config.pattern == "sequence":
+            self.sequence += 1
+            return float(self.sequence % SEQUENCE_MODULO)
+        return config.amplitude * math.sin(2 * math.pi * t / config.period) + random.gauss(0, config.noise)
+
+    def _encode(self, kind, value):
+        if self.config.protocol == "binary":
+            frame = bytearray(encode_frame(FRAME_ROTATION if kind == "r" else FRAME_STATE, value))
+            if random.random() < self.config.corrupt:
+                frame[random.randrange(len(frame))] ^= 1 << random.randrange(8)
+                self.count("corrupted")
+            return bytes(frame)
+        line = f"r:{value:.3f}\n" if kind == "r" else f"s:{value}\n"
+        if random.random() < self.config.corrupt:
+            line = line[:random.randrange(len(line))] + "\n"
+            self.count("corrupted")
+        return line.encode()
+
+    def _run(self):
+        config = self.config
+        start = last = time.monotonic()
+        due_rotation = due_state = 0.0
+        state_index = 0
+        next_dropout = start + config.dropout_every if config.dropout_every else None
+        dropout_until = None
+
+        while not self.stopping.is_set():
+            time.sleep(self.TICK)
+            now = time.monotonic()
+            if config.duration and now - start > config.duration:
+                return
+            elapsed, last = now - last, now
+
+            if dropout_until is not None:
+                if now < dropout_until:
+                    continue
+                dropout_until = None
+                self.resume_times.append(time.perf_counter())
+            elif next_dropout is not None and now >= next_dropout:
+                dropout_until = now + config.dropout_duration
+                next_dropout = dropout_until + config.dropout_every
+                self.count("dropouts")
+                continue
+
+            due_rotation += config.rate * elapsed
+            due_state += config.state_rate * elapsed
+            chunk = []
+            while due_rotation >= 1:
+                due_rotation -= 1
+                roll = self._roll(now - start)
+                chunk.append(self._encode("r", roll))
+                if config.pattern == "sequence":
+                    self.sent_times[int(roll)] = time.perf_counter()
+            while due_state >= 1:
+                due_state -= 1
+                state_index = (state_index + 1) % len(STATE_CYCLE)
+                chunk.append(self._encode("s", STATE_CYCLE[state_index]))
+            if not chunk:
+                continue
+
+            data = b"".join(chunk)
+            try:
+                written = os.write(self.master, data)
+            except BlockingIOError:
+                written = 0
+            self.count("samples", len(chunk))
+            if written < len(data):
+                self.count("overrun_bytes", len(data) - written)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=100.0, help="roll samples per second")
+    parser.add_argument("--state-rate", type=float, default=0.5, help="state samples per second")
+    parser.add_argument("--protocol", choices=("text", "binary"), default="text")
+    parser.add_argument("--pattern", choices=("sine", "sequence"), default="sine",
+                        help="sine sweep, or counting rolls for latency measurements")
+    parser.add_argument("--amplitude", type=float, default=45.0, help="sine amplitude in degrees")
+    parser.add_argument("--period", type=float, default=8.0, help="sine period in seconds")
+    parser.add_argument("--noise", type=float, default=0.0, help="standard deviation of roll noise in degrees")
+    parser.add_argument("--corrupt", type=float, default=0.0, help="fraction of samples with a corrupted byte")
+    parser.add_argument("--dropout-every", type=float, default=0.0,
+                        help="stop sending every this many seconds (0 = never)")
+    parser.add_argument("--dropout-duration", type=float, default=1.0, help="length of each dropout in seconds")
+    parser.add_argument("--duration", type=float, default=0.0,
+                        help="stop after this many seconds (0 = run until interrupted)")
+    return parser
+
+
+def main():
+    config = build_parser().parse_args()
+    emulator = ImuEmulator(config).start()
+    print(f"[IMU Emulator] Streaming on {emulator.slave_path}")
+    try:
+        while emulator.running:
+            time.sleep(5)
+            print(f"[IMU Emulator] {emulator.stats()}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.stop()
+        print(f"[IMU Emulator] Final counts: {emulator.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Replays a session log recorded with SESSION_RECORDING_PATH through the real UI.
+
+The recorded bytes go through the same framing, decoding, conflation and
+UIController path as live traffic, paced in real time, N times faster or as
+fast as possible.
+
+Run from the repository root:
+    python -m tools.replay_session session.log.gz --speed 4
+    python -m tools.replay_session session.log.gz --fast --exit
+"""
+
+import argparse
+import sys
+import time
+
+from PyQt6.QtWidgets import QApplication
+
+from config.settings import TCP_PROTOCOL
+from main import connect_client
+from network.network_worker import create_client
+from network.session_replayer import SessionReplayer
+from ui.ui_controller import UIController
+from ui.ui_setup import launch_ui
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="session log to replay")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed factor (1 = real time)")
+    parser.add_argument("--fast", action="store_true", help="replay as fast as possible")
+    parser.add_argument("--exit", action="store_true", help="quit when the replay is finished")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    app.setStyleSheet("QLabel { color: white; }")
+    _, screen_windows, ring_manager = launch_ui(app, None, app.quit)
+    controller = UIController(ring_manager, screen_windows)
+
+    # A client that never connects; the replayer feeds its receive path directly.
+    client = create_client()
+    connect_client(client, controller)
+    client.error_occurred.connect(lambda error: print(f"[Replay] {error}"))
+
+    replayer = SessionReplayer(client, args.path, 0 if args.fast else args.speed)
+
+    def on_session_started(metadata):
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(metadata.get("wall_time", 0)))
+        print(f"[Replay] Session recorded {started} from {metadata.get('host')}:{metadata.get('port')}")
+        if metadata.get("protocol", TCP_PROTOCOL) != TCP_PROTOCOL:
+            print(f"[Replay] Warning: recorded with TCP_PROTOCOL = {metadata['protocol']!r}, "
+                  f"replaying as {TCP_PROTOCOL!r}")
+
+    wall_start = time.perf_counter()
+
+    def on_finished():
+        wall = time.perf_counter() - wall_start
+        print(f"[Replay] Finished: {replayer.record_count} records, {replayer.byte_count} bytes "
+              f"in {wall:.1f} s, max lag {replayer.max_lag_ms:.1f} ms")
+        if args.exit:
+            app.quit()
+
+    replayer.session_started.connect(on_session_started)
+    replayer.finished.connect(on_finished)
+    replayer.start()
+    app.exec()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Local robot simulator speaking the app's newline-delimited JSON protocol.
+
+Generates state, rotation, liveStats and globalStats traffic at independent
+rates (from below 1 Hz up to several kHz), optionally in bursts, with
+malformed-line injection and periodic disconnects, so TCPClient and
+UIController can be exercised and measured without a robot.
+
+Run from the repository root, then point TCP_HOST at 127.0.0.1 and TCP_PORT
+at --port:
+    python -m tools.robot_simulator --port 30003 --rotation-rate 500 --malformed 0.01
+"""
+
+import argparse
+import json
+import math
+import queue
+import random
+import select
+import socketserver
+import threading
+import time
+
+STATE_CYCLE = ("normal", "reduced_speed", "normal", "stopped", "normal", "idle", "task_finished")
+
+MALFORMED_LINES = (
+    b'{"type": "rotation", "rotation": ',
+    b'\xff\xfe{"type": "state"}',
+    b'{"type": "teleport", "state": "normal"}',
+    b'{"type": "state", "state": "panicking"}',
+    b'{"type": "rotation", "rotation": "x"}',
+    b'not json at all',
+    b'[1, 2, 3]',
+)
+
+
+class TrafficGenerator:
+    """Produces the next message of each type; values evolve over time like a running cell."""
+
+    def __init__(self):
+        self.state_index = 0
+        self.boxes = 0
+        self.pallets = 0
+        self.start = time.monotonic()
+
+    def state(self):
+        self.state_index = (self.state_index + 1) % len(STATE_CYCLE)
+        return {"type": "state", "state": STATE_CYCLE[self.state_index]}
+
+    def rotation(self):
+        t = time.monotonic() - self.start
+        return {"type": "rotation", "rotation": round(30 * math.sin(t / 3), 3)}
+
+    def live_stats(self):
+        self.boxes = (self.boxes + 1) % 5000
+        if self.boxes == 0:
+            self.pallets += 1
+        return {
+            "type": "liveStats",
+            "currentSpeed": random.randint(15, 25),
+            "currentBox": self.boxes,
+            "totalBoxes": 5000,
+            "remainingTime": max(0, (5000 - self.boxes) // 20),
+            "currentPallet": self.pallets,
+            "totalPallets": 200,
+        }
+
+    def global_stats(self):
+        minutes = int(time.monotonic() - self.start) // 60
+        return {
+            "type": "globalStats",
+            "chart": {
+                "units": "min",
+                "bars": [
+                    {"label": "Max. Speed", "value": minutes},
+                    {"label": "Reduced Speed", "value": minutes // 3},
+                    {"label": "Stopped", "value": minutes // 10},
+                ]
+            },
+            "statMetric": "Avg. Speed",
+            "statValue": str(random.randint(15, 25)),
+            "statUnits": "pick/min",
+        }
+
+
+class SimulatorHandler(socketserver.BaseRequestHandler):
+    """
+    Streams generated traffic to one client until it disconnects or a disconnect is due.
+
+    Rates are read from the config on every tick, so they can be changed while
+    running; injected messages are sent on the next tick, without waiting
+    for a burst to fill.
+    """
+    TICK = 0.001
+
+    def handle(self):
+        server = self.server
+        config = server.config
+        generator = TrafficGenerator()
+        producers = (
+            ("state", "state_rate", generator.state),
+            ("rotation", "rotation_rate", generator.rotation),
+            ("liveStats", "live_stats_rate", generator.live_stats),
+            ("globalStats", "global_stats_rate", generator.global_stats),
+        )
+        due = {name: 0.0 for name, _, _ in producers}
+        pending = []
+
+        start = last = time.monotonic()
+        disconnect_at = self._next_disconnect(start)
+        server.count("connections")
+
+        while not server.stopping.is_set():
+            readable, _, _ = select.select([self.request], [], [], self.TICK)
+            try:
+                if readable and not self.request.recv(4096):
+                    return
+            except OSError:
+                return  # reset by the client, e.g. when it stops with unread data
+
+            now = time.monotonic()
+            if config.duration and now - server.started > config.duration:
+                return
+            if disconnect_at is not None and now >= disconnect_at:
+                server.count("disconnects")
+                return
+
+            elapsed, last = now - last, now
+            for name, rate, produce in producers:
+                due[name] += getattr(config, rate) * elapsed
+                while due[name] >= 1:
+                    due[name] -= 1
+                    if random.random() < config.malformed:
+                        pending.append(random.choice(MALFORMED_LINES))
+                        server.count("malformed")
+                    else:
+                        pending.append(json.dumps(produce(), separators=(",", ":")).encode())
+                        server.count(name)
+
+            injected = 0
+            while not server.injected.empty():
+                pending.append(json.dumps(server.injected.get(), separators=(",", ":")).encode())
+                injected += 1
+
+            if pending and (injected or len(pending) >= config.burst):
+                try:
+                    self.request.sendall(b"\n".join(pending) + b"\n")
+                except OSError:
+                    return
+                server.count("lines", len(pending))
+                pending.clear()
+                if injected:
+                    server.count("injected", injected)
+                    server.injected_sent.append(time.perf_counter())
+
+    def _next_disconnect(self, now):
+        config = self.server.config
+        if not config.disconnect_every:
+            return None
+        jitter = random.uniform(-config.disconnect_jitter, config.disconnect_jitter)
+        return now + max(0.1, config.disconnect_every + jitter)
+
+
+class RobotSimulator(socketserver.ThreadingTCPServer):
+    """Threaded simulator server; use start()/stop() to run it in the background."""
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, config):
+        super().__init__((config.host, config.port), SimulatorHandler)
+        self.config = config
+        self.started = time.monotonic()
+        self.stopping = threading.Event()
+        self.counters = {}
+        self.injected = queue.SimpleQueue()
+        self.injected_sent = []
+        self._lock = threading.Lock()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters)
+
+    def inject(self, message):
+        """Queue a message for the connected client; its send time is appended to injected_sent."""
+        self.injected.put(message)
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name="RobotSimulator", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.stopping.set()
+        self.shutdown()
+        self.server_close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=30003)
+    parser.add_argument("--state-rate", type=float, default=0.2, help="state messages per second")
+    parser.add_argument("--rotation-rate", type=float, default=30.0, help="rotation messages per second")
+    parser.add_argument("--live-stats-rate", type=float, default=1.0, help="liveStats messages per second")
+    parser.add_argument("--global-stats-rate", type=float, default=0.1, help="globalStats messages per second")
+    parser.add_argument("--burst", type=int, default=1,
+                        help="hold messages back and send them in bursts of this many lines")
+    parser.add_argument("--malformed", type=float, default=0.0,
+                        help="fraction of lines replaced by malformed ones")
+    parser.add_argument("--disconnect-every", type=float, default=0.0,
+                        help="close each connection after this many seconds (0 = never)")
+    parser.add_argument("--disconnect-jitter", type=float, default=0.0,
+                        help="random +/- seconds added to --disconnect-every")
+    parser.add_argument("--duration", type=float, default=0.0,
+                        help="stop sending after this many seconds (0 = run until interrupted)")
+    return parser
+
+
+def main():
+    config = build_parser().parse_args()
+    simulator = RobotSimulator(config)
+    print(f"[Simulator] Listening on {config.host}:{simulator.port}")
+    simulator.start()
+    try:
+        while not config.duration or time.monotonic() - simulator.started < config.duration:
+            time.sleep(5)
+            print(f"[Simulator] {simulator.stats()}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
+        print(f"[Simulator] Final counts: {simulator.stats()}")
+
+
+if __name__ == "__main__":
+    main()
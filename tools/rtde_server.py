@@ -0,0 +1,172 @@
+"""
+Local stand-in for the RTDE interface of a UR controller.
+
+Implements the protocol version, output setup, start and pause requests of
+RTDE v2 and streams synthetic data packages at the frequency requested by the
+client: joint positions sweep slowly and the safety status / speed scaling
+cycle through normal, reduced speed and protective stop.
+
+Run from the repository root, then point TCP_HOST at 127.0.0.1 and set
+TCP_PROTOCOL = "rtde" (and RTDE_PORT to --port if changed):
+    python -m tools.rtde_server --port 30004
+"""
+
+import argparse
+import math
+import select
+import socketserver
+import struct
+import threading
+import time
+
+from network.rtde_client import (
+    HEADER, TYPE_FORMATS, COMMAND_REQUEST_PROTOCOL_VERSION, COMMAND_CONTROL_PACKAGE_SETUP_OUTPUTS,
+    COMMAND_CONTROL_PACKAGE_START, COMMAND_CONTROL_PACKAGE_PAUSE, COMMAND_DATA_PACKAGE,
+    pack_message, recipe_struct
+)
+
+VARIABLE_TYPES = {
+    "timestamp": "DOUBLE",
+    "actual_q": "VECTOR6D",
+    "actual_qd": "VECTOR6D",
+    "actual_TCP_pose": "VECTOR6D",
+    "robot_mode": "INT32",
+    "safety_mode": "INT32",
+    "safety_status": "INT32",
+    "runtime_state": "UINT32",
+    "speed_scaling": "DOUBLE",
+    "target_speed_fraction": "DOUBLE",
+}
+
+# (safety status, speed scaling) phases of the synthetic scenario.
+PHASES = ((1, 1.0), (1, 0.4), (3, 0.0))
+
+
+def synthetic_values(t, phase_duration):
+    """Values of every known variable at time t seconds after streaming started."""
+    safety_status, speed_scaling = PHASES[int(t // phase_duration) % len(PHASES)]
+    q = [0.0, -1.57, 1.57, -1.57, -1.57, math.radians(45) * math.sin(t / 4)]
+    return {
+        "timestamp": t,
+        "actual_q": q,
+        "actual_qd": [0.0] * 6,
+        "actual_TCP_pose": [0.0] * 6,
+        "robot_mode": 7,
+        "safety_mode": safety_status,
+        "safety_status": safety_status,
+        "runtime_state": 2,
+        "speed_scaling": speed_scaling,
+        "target_speed_fraction": 1.0,
+    }
+
+
+class RTDERequestHandler(socketserver.BaseRequestHandler):
+    def setup(self):
+        self.buffer = bytearray()
+        self.recipe = None
+        self.outputs = ()
+        self.frequency = 125.0
+        self.streaming = False
+        self.packages_sent = 0
+
+    def handle(self):
+        sock = self.request
+        start = time.monotonic()
+        next_send = start
+        while not self.server.stopping.is_set():
+            timeout = max(0.0, next_send - time.monotonic()) if self.streaming else 0.1
+            readable, _, _ = select.select([sock], [], [], timeout)
+            if readable:
+                data = sock.recv(65536)
+                if not data:
+                    return
+                self.buffer += data
+                self._handle_requests(sock)
+
+            now = time.monotonic()
+            if self.streaming and now >= next_send:
+                values = synthetic_values(now - start, self.server.phase_duration)
+                flat = []
+                for name in self.outputs:
+                    value = values[name]
+                    flat.extend(value if isinstance(value, list) else [value])
+                try:
+                    sock.sendall(pack_message(COMMAND_DATA_PACKAGE, bytes([1]) + self.recipe.pack(*flat)))
+                except OSError:
+                    return
+                self.packages_sent += 1
+                next_send = max(next_send + 1 / self.frequency, now - 1 / self.frequency)
+
+    def _handle_requests(self, sock):
+        while len(self.buffer) >= HEADER.size:
+            size, command = HEADER.unpack_from(self.buffer)
+            if len(self.buffer) < size:
+                return
+            payload = bytes(self.buffer[HEADER.size:size])
+            del self.buffer[:size]
+
+            if command == COMMAND_REQUEST_PROTOCOL_VERSION:
+                version = struct.unpack(">H", payload)[0]
+                sock.sendall(pack_message(command, bytes([version == 2])))
+            elif command == COMMAND_CONTROL_PACKAGE_SETUP_OUTPUTS:
+                self.frequency = struct.unpack_from(">d", payload)[0]
+                self.outputs = tuple(payload[8:].decode().split(","))
+                types = [VARIABLE_TYPES.get(name, "NOT_FOUND") for name in self.outputs]
+                if all(kind in TYPE_FORMATS for kind in types):
+                    self.recipe = recipe_struct(types)
+                sock.sendall(pack_message(command, bytes([1]) + ",".join(types).encode()))
+            elif command == COMMAND_CONTROL_PACKAGE_START:
+                self.streaming = self.recipe is not None
+                sock.sendall(pack_message(command, bytes([self.streaming])))
+            elif command == COMMAND_CONTROL_PACKAGE_PAUSE:
+                self.streaming = False
+                sock.sendall(pack_message(command, bytes([1])))
+
+
+class RTDEServer(socketserver.ThreadingTCPServer):
+    """Threaded stand-in server; use start()/stop() to run it in the background."""
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=30004, phase_duration=5.0):
+        super().__init__((host, port), RTDERequestHandler)
+        self.phase_duration = phase_duration
+        self.stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="RTDEServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.stopping.set()
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=30004)
+    parser.add_argument("--phase-duration", type=float, default=5.0,
+                        help="Seconds spent in each of normal, reduced speed and protective stop")
+    args = parser.parse_args()
+
+    server = RTDEServer(args.host, args.port, args.phase_duration)
+    print(f"[RTDE] Stand-in server listening on {args.host}:{server.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stopping.set()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import time
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
+from config.settings import FRAME_INTERVAL_MS, FRAME_IDLE_INTERVAL_MS, FRAME_BUDGET_MS, FRAME_ALIGN_TO_DISPLAY
+from utils.latency import LatencyStats
+
+
+def display_refresh_interval():
+    """Refresh period (ms) of the primary screen, or None if it is unknown."""
+    screen = QGuiApplication.primaryScreen()
+    rate = screen.refreshRate() if screen else 0
+    return 1000 / rate if rate > 0 else None
+
+
+class FrameScheduler(QObject):
+    """
+    Emits frame at a fixed cadence aligned to the display refresh.
+
+    Intervals are rounded to whole refresh periods and frames are scheduled
+    against absolute deadlines with a precise single-shot timer, so the
+    cadence does not drift and a late frame does not delay the next ones. In
+    low-power mode the cadence drops to FRAME_IDLE_INTERVAL_MS; request_frame
+    runs a frame right away, e.g. to show a state change without waiting out
+    the idle interval. The time spent in the frame handlers is tracked against
+    FRAME_BUDGET_MS.
+    """
+    frame = pyqtSignal()
+
+    def __init__(self, interval_ms=FRAME_INTERVAL_MS, idle_interval_ms=FRAME_IDLE_INTERVAL_MS,
+                 budget_ms=FRAME_BUDGET_MS, parent=None):
+        super().__init__(parent)
+        self.refresh_interval = display_refresh_interval() if FRAME_ALIGN_TO_DISPLAY else None
+        self.active_interval = self._aligned(interval_ms)
+        self.idle_interval = self._aligned(idle_interval_ms)
+        self.budget = budget_ms / 1000
+        self.low_power = False
+
+        self.frame_time = LatencyStats()
+        self.over_budget_count = 0
+        self.missed_count = 0
+
+        self._deadline = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._run_frame)
+
+    @property
+    def interval(self):
+        """Current frame interval in ms."""
+        return self.idle_interval if self.low_power else self.active_interval
+
+    def _aligned(self, interval_ms):
+        if not self.refresh_interval:
+            return float(interval_ms)
+        return max(1, round(interval_ms / self.refresh_interval)) * self.refresh_interval
+
+    def start(self):
+        self._deadline = time.perf_counter() * 1000
+        self._timer.start(0)
+
+    def stop(self):
+        self._timer.stop()
+        self._deadline = None
+
+    def set_low_power(self, enabled):
+        if enabled == self.low_power:
+            return
+        self.low_power = enabled
+
+    def request_frame(self):
+        """Run the next frame as soon as possible and continue the cadence from it."""
+        if self._deadline is not None:
+            self._deadline = time.perf_counter() * 1000
+            self._timer.start(0)
+
+    def _run_frame(self):
+        start = time.perf_counter()
+        self.frame.emit()
+        elapsed = time.perf_counter() - start
+        self.frame_time.add(elapsed)
+        if elapsed > self.budget:
+            self.over_budget_count += 1
+
+        if self._deadline is None:
+            return
+        now = time.perf_counter() * 1000
+        self._deadline += self.interval
+        if self._deadline < now:
+            # Skip the frames that can no longer be made instead of running them back to back.
+            missed = int((now - self._deadline) // self.interval) + 1
+            self.missed_count += missed
+            self._deadline += missed * self.interval
+        self._timer.start(max(0, round(self._deadline - now)))
+
+    def stats(self):
+        return {
+            "interval_ms": round(self.interval, 2),
+            "refresh_ms": round(self.refresh_interval, 2) if self.refresh_interval else None,
+            "low_power": self.low_power,
+            "frame_time": self.frame_time.summary(),
+            "over_budget": self.over_budget_count,
+            "missed": self.missed_count,
+        }
@@ -1,6 +1,9 @@
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal, QDateTime, QPointF
+import time
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal, QPointF
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, NamedTuple
+from ui.frame_scheduler import FrameScheduler
 
 @dataclass
 class RingState:
@@ -17,48 +20,119 @@ WARNING_STATE = RingState((255, 255, 0), 2000, 5000, 0.07, 6000.0, 0.15, 0.85)
 ERROR_STATE = RingState((255, 0, 0), 1200, 1000, 0.1, 6000.0, 0.2, 0.8)
 IDLE_STATE = RingState((0, 0, 255), 3000, 6000, 0.05, 6000.0, 0.1, 0.9)
 
-class Ring:
-    def __init__(self, state: RingState, center: Optional[QPointF] = None):
-        self.state = state
-        self.center = center
-        self.creation_time = QDateTime.currentMSecsSinceEpoch()
+RING_STATES = (NORMAL_STATE, WARNING_STATE, ERROR_STATE, IDLE_STATE)
+RING_LIFETIMES = np.array([state.lifetime for state in RING_STATES], dtype=float)
+RING_MAX_THICKNESSES = np.array([state.max_thickness for state in RING_STATES])
+
+FADE_LUT_SIZE = 4096
+
+# States in which the frame scheduler drops to its low-power cadence.
+LOW_POWER_STATES = ("idle", "task_finished")
+
+
+def fade_lut(state, size=FADE_LUT_SIZE):
+    """Ring alpha (0-255) over its progress, sampled at size points from 0 to 1."""
+    t = np.linspace(0.0, 1.0, size)
+    fade = np.ones(size)
+    fading_out = t > 1 - state.fade_out
+    fade[fading_out] = (1 - t[fading_out]) / state.fade_out
+    fading_in = t < state.fade_in
+    fade[fading_in] = t[fading_in] / state.fade_in
+    return (255 * fade).astype(np.uint8)
+
+
+FADE_LUTS = np.stack([fade_lut(state) for state in RING_STATES])
+
 
-    def progress(self):
-        current_time = QDateTime.currentMSecsSinceEpoch()
-        t = (current_time - self.creation_time) / self.state.lifetime
-        return min(max(t, 0.0), 1.0)
+class RingFrame(NamedTuple):
+    """One ring as painted in a frame."""
+    radius: float
+    outer_radius: float
+    inner_stop: float
+    mid_stop: float
+    alpha: int
+    color: tuple
 
-    def radius(self):
-        return self.progress() * self.state.speed * self.state.lifetime
 
-    def thickness(self):
-        return self.progress() * self.state.max_thickness
+def ring_snapshot(created, state_index, speed, now):
+    """
+    Progress of every ring at now (ms) and the rings to paint, in one vectorized pass.
+
+    Returns (alive mask, list of RingFrame of the rings thick enough to draw, oldest first).
+    """
+    lifetime = RING_LIFETIMES[state_index]
+    progress = np.clip((now - created) / lifetime, 0.0, 1.0)
+    alive = progress < 1.0
+
+    radius = progress * speed * lifetime
+    thickness = progress * RING_MAX_THICKNESSES[state_index]
+    drawn = alive & (thickness >= 1.0)
+    if not drawn.any():
+        return alive, []
+
+    radius, thickness, progress, state_index = radius[drawn], thickness[drawn], progress[drawn], state_index[drawn]
+    outer_radius = radius + thickness / 2
+    inner_stop = np.maximum(0.0, radius - thickness / 2) / outer_radius
+    mid_stop = radius / outer_radius
+    alpha = FADE_LUTS[state_index, (progress * (FADE_LUT_SIZE - 1)).astype(np.intp)]
+    return alive, [
+        RingFrame(*values, RING_STATES[index].color)
+        for *values, index in zip(
+            radius.tolist(), outer_radius.tolist(), inner_stop.tolist(), mid_stop.tolist(), alpha.tolist(),
+            state_index.tolist()
+        )
+    ]
 
-    def fade_factor(self):
-        t = self.progress()
-        if t < self.state.fade_in:
-            return t / self.state.fade_in
-        elif t > 1 - self.state.fade_out:
-            return (1 - t) / self.state.fade_out
-        return 1.0
 
 class RingManager(QObject):
+    """
+    Rings shared by all screens, stored as arrays of creation time, state and speed.
+
+    Once per frame, updateAnimation computes a snapshot of the rings to paint
+    (RingFrame list) for all RingViewWidgets, so ring geometry and fades are
+    evaluated once per frame instead of per ring, widget and call.
+
+    Frames come from a FrameScheduler, which slows down while the robot is
+    idle or finished. rings_updated (and with it the repaint of every ring
+    view) is skipped for frames in which no ring is visible before or after.
+    Only the rings are throttled: request_tick still delivers frame_tick
+    within the active frame interval.
+    """
+    # Emitted once per scheduled frame, before the rings advance; shared frame tick of the UI.
+    frame_tick = pyqtSignal()
     rings_updated = pyqtSignal()
 
     def __init__(self):
         super().__init__()
         self.state = NORMAL_STATE
-        self.rings: List[Ring] = []
         self.center = QPointF(0, 0)
+        self.snapshot: List[RingFrame] = []
+        self.skipped_frame_count = 0
+        self._needs_repaint = True
+
+        self._created = np.empty(0)
+        self._state_index = np.empty(0, dtype=np.intp)
+        self._speed = np.empty(0)
 
-        self.anim_timer = QTimer(self)
-        self.anim_timer.timeout.connect(self.updateAnimation)
-        self.anim_timer.start(33)
+        # Extra frame ticks requested while the rings run at the low-power cadence.
+        self._last_tick = 0.0
+        self._tick_timer = QTimer(self)
+        self._tick_timer.setSingleShot(True)
+        self._tick_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._tick_timer.timeout.connect(self._tick)
+
+        self.scheduler = FrameScheduler(parent=self)
+        self.scheduler.frame.connect(self.updateAnimation)
+        self.scheduler.start()
 
         self.new_ring_timer = QTimer(self)
         self.new_ring_timer.timeout.connect(self.createNewRing)
         self.new_ring_timer.start(self.state.frequency)
 
+    @property
+    def ring_count(self):
+        return len(self._created)
+
     def update_state(self, state_str):
         if state_str == "normal":
             self.state = NORMAL_STATE
@@ -69,23 +143,53 @@ class RingManager(QObject):
         else:
             self.state = IDLE_STATE
 
-        self.rings = self.rings[:-1]
-        for ring in self.rings:
-            ring.state.speed = self.state.speed
+        # Drop the newest ring and let the others continue at the new state's speed.
+        self._keep(slice(None, -1))
+        self._speed[:] = self.state.speed
         self.new_ring_timer.stop()
         self.new_ring_timer.setInterval(self.state.frequency)
         self.new_ring_timer.start()
 
         self.createNewRing()
+        self.scheduler.set_low_power(state_str in LOW_POWER_STATES)
+        self.scheduler.request_frame()
 
     def set_center(self, center: QPointF):
         self.center = center
+        self._needs_repaint = True
 
 
     def createNewRing(self):
-        self.rings.append(Ring(self.state, self.center))
+        self._created = np.append(self._created, time.monotonic() * 1000)
+        self._state_index = np.append(self._state_index, RING_STATES.index(self.state))
+        self._speed = np.append(self._speed, self.state.speed)
 
+    def _keep(self, selection):
+        self._created = self._created[selection]
+        self._state_index = self._state_index[selection]
+        self._speed = self._speed[selection]
+
+
+    def request_tick(self):
+        """Emit frame_tick within the active frame interval, even if the rings run at the low-power cadence."""
+        if not self.scheduler.low_power or self._tick_timer.isActive():
+            return
+        wait = self._last_tick + self.scheduler.active_interval - time.perf_counter() * 1000
+        self._tick_timer.start(max(0, round(wait)))
+
+    def _tick(self):
+        self._last_tick = time.perf_counter() * 1000
+        self.frame_tick.emit()
 
     def updateAnimation(self):
-        self.rings = [ring for ring in self.rings if ring.progress() < 1.0]
-        self.rings_updated.emit()
+        self._tick_timer.stop()
+        self._tick()
+        previous = self.snapshot
+        alive, self.snapshot = ring_snapshot(self._created, self._state_index, self._speed, time.monotonic() * 1000)
+        if not alive.all():
+            self._keep(alive)
+        if self._needs_repaint or self.snapshot or previous:
+            self._needs_repaint = False
+            self.rings_updated.emit()
+        else:
+            self.skipped_frame_count += 1
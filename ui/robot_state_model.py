@@ -0,0 +1,85 @@
+from utils.enums import MessageType
+
+# Stats messages may carry only the fields that changed, so pending ones are
+# merged instead of replaced to avoid losing values within a frame.
+MERGED_TOPICS = {MessageType.LIVE_STATS, MessageType.GLOBAL_STATS}
+
+
+class RobotStateModel:
+    """
+    Latest robot state, written by incoming messages and applied to the widgets once per frame.
+
+    Writes only record the newest value of a field and mark it dirty, so they
+    cost the same whatever the message rate. take_changes() is called from the
+    frame tick and returns the dirty fields that differ from the values applied
+    last, replacing MessageConflator on the frame-synchronized path.
+
+    Fields are keyed by (topic, screen index); the screen index is only used
+    for rotations, which are tracked per screen, and is None otherwise.
+    """
+
+    def __init__(self, screen_count):
+        self.screen_count = screen_count
+        self._dirty = {}
+        self._applied = {}
+
+        self.write_count = 0
+        self.superseded_count = 0
+        self.unchanged_count = 0
+        self.applied_count = 0
+        self.frame_count = 0
+
+    def write(self, topic, value, screen_index=None):
+        """Set a field; a rotation with a negative or no screen index applies to every screen."""
+        self.write_count += 1
+        if topic == MessageType.ROTATION:
+            if screen_index is None or screen_index < 0:
+                indices = range(self.screen_count)
+            elif screen_index < self.screen_count:
+                indices = (screen_index,)
+            else:
+                return
+            for index in indices:
+                self._set((topic, index), value)
+        else:
+            self._set((topic, None), value)
+
+    def _set(self, key, value):
+        pending = self._dirty.get(key)
+        if pending is not None:
+            self.superseded_count += 1
+            if key[0] in MERGED_TOPICS:
+                value = pending.merged(value)
+        self._dirty[key] = value
+
+    @property
+    def dirty(self):
+        return bool(self._dirty)
+
+    def take_changes(self):
+        """Return ((topic, screen index), value) pairs of the fields changed since the last frame."""
+        dirty, self._dirty = self._dirty, {}
+        changes = []
+        for key, value in dirty.items():
+            if self._applied.get(key) == value:
+                self.unchanged_count += 1
+                continue
+            self._applied[key] = value
+            changes.append((key, value))
+        if changes:
+            self.frame_count += 1
+            self.applied_count += len(changes)
+        return changes
+
+    def reset(self):
+        """Forget the applied values, e.g. after the connection was lost."""
+        self._applied.clear()
+
+    def stats(self):
+        return {
+            "written": self.write_count,
+            "superseded": self.superseded_count,
+            "unchanged": self.unchanged_count,
+            "applied": self.applied_count,
+            "frames": self.frame_count,
+        }
@@ -1,10 +1,19 @@
-from PyQt6.QtWidgets import QMainWindow, QStackedLayout, QWidget
+from PyQt6.QtWidgets import QMainWindow, QStackedLayout, QWidget, QLabel
 from PyQt6.QtCore import pyqtSignal, Qt
 from config.settings import SCREEN_CLASSES_BY_INDEX
 from ui.widgets.ring_view_widget import RingViewWidget
 from ui.screens.ring_screen import RingScreen
 from ui.screens.bar_chart_info_screen import BarChartInfoScreen
 from ui.screens.live_stats_screen import LiveStatsScreen
+from ui.subscriptions import SubscriptionRegistry, TRACKED_STATS
+from ui.widgets.dual_screen_widget import DualScreenWidget
+from utils.enums import MessageType
+
+CONNECTION_STATE_TEXT = {
+    "connecting": "Connecting to robot...",
+    "backoff": "Robot unreachable, retrying...",
+    "disconnected": "Robot disconnected",
+}
 
 SCREEN_CLASS_MAP = {
     "RingScreen": RingScreen,
@@ -38,6 +47,14 @@ class ScreenWindow(QMainWindow):
         self.layout.setStackingMode(QStackedLayout.StackingMode.StackAll)
         self.ring_view.lower()
 
+        self.subscriptions = SubscriptionRegistry()
+        self._subscribe_content()
+
+        self.connection_label = QLabel(self.central)
+        self.connection_label.setStyleSheet("background: transparent; font-family: 'DM Sans'; font-size: 14px;")
+        self.connection_label.move(10, 10)
+        self.connection_label.hide()
+
     def get_screen_class(self):
         screen_list = SCREEN_CLASSES_BY_INDEX.get(self.total_screens, [])
         if self.screen_index < len(screen_list):
@@ -51,7 +68,6 @@ class ScreenWindow(QMainWindow):
                 cls_1 = SCREEN_CLASS_MAP.get(entry[1], lambda config: QWidget())
 
                 def create_dual_widget(config):
-                    from ui.widgets.dual_screen_widget import DualScreenWidget
                     return DualScreenWidget(cls_0(config), cls_1(config))
 
                 return create_dual_widget
@@ -60,6 +76,22 @@ class ScreenWindow(QMainWindow):
         return lambda config: QWidget()
 
 
+    def _subscribe_content(self):
+        """Subscribe the content widgets to the updates they handle, once, instead of searching for them per message."""
+        content = self.content_widget
+        if hasattr(content, "update_state"):
+            self.subscriptions.subscribe(MessageType.STATE, content.update_state)
+        if hasattr(content, "rotate"):
+            self.subscriptions.subscribe(MessageType.ROTATION, content.rotate)
+
+        pages = [content.widget_0, content.widget_1] if isinstance(content, DualScreenWidget) else [content]
+        for page in pages:
+            if isinstance(page, LiveStatsScreen):
+                self.subscriptions.subscribe(MessageType.LIVE_STATS, page.update_live_stats)
+            if isinstance(page, BarChartInfoScreen):
+                self.subscriptions.subscribe(MessageType.GLOBAL_STATS, page.update_global_stats)
+                self.subscriptions.subscribe(TRACKED_STATS, page.chart_view.receive_data)
+
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
             self.key_pressed.emit()
@@ -69,6 +101,17 @@ class ScreenWindow(QMainWindow):
         if hasattr(self.content_widget, "update_robot_state"):
             self.content_widget.update_robot_state(state)
 
+    def update_connection_state(self, state):
+        """Show the connection state in the corner while not connected to the robot."""
+        text = CONNECTION_STATE_TEXT.get(state)
+        if text is None:
+            self.connection_label.hide()
+            return
+        self.connection_label.setText(text)
+        self.connection_label.adjustSize()
+        self.connection_label.show()
+        self.connection_label.raise_()
+
     def rotate(self, angle):
         if hasattr(self.content_widget, "rotate"):
             self.content_widget.rotate(angle)
@@ -64,25 +64,25 @@ class LiveStatsScreen(QWidget):
             case _:
                 self.widget1.svg_renderer.load("assets/live_speed_fast.svg")
 
-    def update_live_stats(self, message):
-        stats = {
-        "currentSpeed": self.widget1,
-        "currentBox": self.widget2,
-        "remainingTime": self.widget3,
-        "currentPallet": self.widget4,
-        }
-
-        total = {
-            "totalBoxes": self.widget2,
-            "totalPallets": self.widget4,
-        }
-
-        for key, widget in stats.items():
-            if (value := message.get(key)) is not None and isinstance(value, int):
+    def update_live_stats(self, stats):
+        """Apply a validated LiveStatsMessage; fields that are None were not sent."""
+        values = (
+            (stats.current_speed, self.widget1),
+            (stats.current_box, self.widget2),
+            (stats.remaining_time, self.widget3),
+            (stats.current_pallet, self.widget4),
+        )
+        totals = (
+            (stats.total_boxes, self.widget2),
+            (stats.total_pallets, self.widget4),
+        )
+
+        for value, widget in values:
+            if value is not None:
                 widget.set_value(str(value))
 
-        for key, widget in total.items():
-            if (value := message.get(key)) is not None and isinstance(value, int):
+        for value, widget in totals:
+            if value is not None:
                 widget.set_label("/ " + str(value))
 
 
@@ -0,0 +1,34 @@
+"""Topic-indexed subscriber lists, so updates reach their widgets without walking the widget tree."""
+
+# Topic of the bar data computed by UIController's internal state timer.
+TRACKED_STATS = "trackedStats"
+
+
+class SubscriptionRegistry:
+    """
+    Maps a topic (a MessageType or TRACKED_STATS) to the callbacks subscribed to it.
+
+    Widgets join once when their ScreenWindow is built; publishing then only
+    visits the subscribers of that topic.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+
+    def subscribe(self, topic, callback):
+        self._subscribers.setdefault(topic, []).append(callback)
+
+    def subscribers(self, topic):
+        return self._subscribers.get(topic, ())
+
+    def publish(self, topic, *args):
+        for callback in self._subscribers.get(topic, ()):
+            callback(*args)
+
+    def extend(self, other):
+        """Add all subscriptions of another registry, e.g. to combine the screens' registries."""
+        for topic, callbacks in other._subscribers.items():
+            self._subscribers.setdefault(topic, []).extend(callbacks)
+
+    def __len__(self):
+        return sum(len(callbacks) for callbacks in self._subscribers.values())
@@ -1,23 +1,41 @@
 from PyQt6.QtCore import QTimer
-from PyQt6.QtWidgets import QWidget
 from utils.enums import MessageType, State
-from ui.screens.live_stats_screen import LiveStatsScreen
+from utils.messages import as_message, RotationMessage
 from ui.screens.bar_chart_info_screen import BarChartInfoScreen
+from ui.robot_state_model import RobotStateModel
+from ui.subscriptions import SubscriptionRegistry, TRACKED_STATS
 from ui.widgets.dual_screen_widget import DualScreenWidget
-from utils.utils import format_time_sec
-from config.settings import INTERNAL_TIME_COUNTER, ROTATION_THRESHOLD, LIVE_STATS_AVAILABLE, SWITCH_SCREEN_INTERVAL
+from utils.state_timer import StateTimerManager
+from config.settings import (
+    INTERNAL_TIME_COUNTER, ROTATION_THRESHOLD, LIVE_STATS_AVAILABLE, SWITCH_SCREEN_INTERVAL, FRAME_SYNCED_UPDATES,
+    STATE_PRIORITY_LANE
+)
 
 class UIController:
     def __init__(self, ring_manager, screen_windows):
         self.ring_manager = ring_manager
         self.screen_windows = screen_windows
         self.current_rotation = 0
+        self.screen_rotations = [0] * len(screen_windows)
+
+        self.subscriptions = SubscriptionRegistry()
+        for screen in screen_windows:
+            self.subscriptions.extend(screen.subscriptions)
         self.current_state = State.NORMAL
 
+        # With FRAME_SYNCED_UPDATES, messages only write the model and the
+        # widgets are updated from it on the ring manager's frame tick. State
+        # changes in the priority lane are applied right away instead.
+        self.frame_synced = FRAME_SYNCED_UPDATES
+        self.immediate_types = {MessageType.STATE} if STATE_PRIORITY_LANE else set()
+        self.model = RobotStateModel(len(screen_windows))
+        if self.frame_synced:
+            ring_manager.frame_tick.connect(self.apply_model)
+
         if INTERNAL_TIME_COUNTER:
             self.state_timer = StateTimerManager()
             self.stats_update_timer = QTimer()
-            self.stats_update_timer.timeout.connect(self._tick_and_update)
+            self.stats_update_timer.timeout.connect(self._refresh_tracked_stats)
             self.stats_update_timer.start(1000)
 
         if LIVE_STATS_AVAILABLE and len(self.screen_windows) == 2:
@@ -25,43 +43,64 @@ class UIController:
             self._screen_switch_timer.timeout.connect(self._switch_bottom_screen)
             self._screen_switch_timer.start(SWITCH_SCREEN_INTERVAL)
 
-    def _tick_and_update(self):
-        self.state_timer._tick()
-        self.update_tracked_stats()
-
-    def handle_message(self, message):
-        message_type = message.get("type")
+    def _refresh_tracked_stats(self):
+        # Durations come from transition timestamps; the timer only refreshes the display.
+        if self.frame_synced:
+            self._write_model(TRACKED_STATS, self.state_timer.get_bar_data())
+        else:
+            self.update_tracked_stats()
 
+    def handle_message(self, message, screen_index=None):
         try:
-            match MessageType(message_type):
-                case MessageType.STATE:
-                    self.update_state(message)
-                case MessageType.ROTATION:
-                    self.update_rotation(message)
-                case MessageType.LIVE_STATS:
-                    self.update_live_stats(message)
-                case MessageType.GLOBAL_STATS:
-                    self.update_global_stats(message)
-                case _:
-                    print(f"[UIController] Unknown message type: {message_type}")
+            message = as_message(message)
         except ValueError as e:
-            print(f"[UIController] Invalid message type: {e}")
+            print(f"[UIController] Invalid message: {e}")
+            return
+
+        if self.frame_synced and message.type not in self.immediate_types:
+            self._write_model(message.type, message, screen_index)
+        else:
+            self._apply(message.type, message, screen_index)
+
+    def _write_model(self, topic, value, screen_index=None):
+        # The first change since the last frame asks for a tick, in case the rings run at the low-power cadence.
+        if not self.model.dirty:
+            self.ring_manager.request_tick()
+        self.model.write(topic, value, screen_index)
+
+    def apply_model(self):
+        """Apply the fields written since the last frame; called once per frame tick."""
+        if self.model.dirty:
+            for (topic, screen_index), value in self.model.take_changes():
+                self._apply(topic, value, screen_index)
+
+    def _apply(self, topic, value, screen_index=None):
+        match topic:
+            case MessageType.STATE:
+                self.update_state(value)
+            case MessageType.ROTATION:
+                self.update_rotation(value, screen_index)
+            case MessageType.LIVE_STATS:
+                self.update_live_stats(value)
+            case MessageType.GLOBAL_STATS:
+                self.update_global_stats(value)
+            case _ if topic == TRACKED_STATS:
+                self.subscriptions.publish(TRACKED_STATS, value)
 
     def update_state(self, message):
         try:
-            state = State(message.get("state"))
-            
-            if len(message)==2 and state == self.current_state:
+            state = message.state
+
+            if not message.has_text_overrides and state == self.current_state:
                 return
-            
-            self.ring_manager.update_state(message.get("state"))
+
+            self.ring_manager.update_state(state.value)
 
             for screen in self.screen_windows:
                 if hasattr(screen, "update_robot_state"):
-                    screen.update_robot_state(message.get("state"))
+                    screen.update_robot_state(state.value)
 
-                for widget in self._get_all_screen_widgets(screen):
-                    widget.update_state(message)
+                screen.subscriptions.publish(MessageType.STATE, message)
 
             if INTERNAL_TIME_COUNTER:
                 mapped_state = None
@@ -98,37 +137,40 @@ class UIController:
         except (ValueError, KeyError) as e:
             print(f"[UIController] Invalid or missing state: {e}")
 
-    def update_rotation(self, message):
-        rotation = message.get("rotation")
-        if isinstance(rotation, (int, float)) and abs(rotation - self.current_rotation) > ROTATION_THRESHOLD:
-            self.current_rotation = rotation
-            for screen in self.screen_windows:
-                for widget in self._get_all_screen_widgets(screen):
-                    widget.rotate(rotation)
+    def update_rotation(self, message, screen_index=None):
+        """Rotate the widgets of one screen, or of all screens if screen_index is None or negative."""
+        rotation = message.rotation
+        if rotation is None:
+            return
+        if screen_index is None or screen_index < 0:
+            indices = range(len(self.screen_windows))
+        elif screen_index < len(self.screen_windows):
+            indices = (screen_index,)
+        else:
+            return
+
+        for index in indices:
+            if abs(rotation - self.screen_rotations[index]) > ROTATION_THRESHOLD:
+                self.screen_rotations[index] = rotation
+                self.screen_windows[index].subscriptions.publish(MessageType.ROTATION, rotation)
+        self.current_rotation = rotation
 
     def update_live_stats(self, message):
-        for screen in self.screen_windows:
-            for widget in self._get_all_screen_widgets(screen):  
-                for live_Stats_widget in self._find_class_widgets(widget, LiveStatsScreen):
-                    live_Stats_widget.update_live_stats(message)
+        self.subscriptions.publish(MessageType.LIVE_STATS, message)
 
     def update_global_stats(self, message):
-        for screen in self.screen_windows:
-            for widget in self._get_all_screen_widgets(screen):
-                for barchart_widget in self._find_class_widgets(widget, BarChartInfoScreen):
-                    if hasattr(barchart_widget, "chart_view"):
-                        widget.update_global_stats(message)
+        self.subscriptions.publish(MessageType.GLOBAL_STATS, message)
 
     def update_tracked_stats(self):
-        data = self.state_timer.get_bar_data()
+        self.subscriptions.publish(TRACKED_STATS, self.state_timer.get_bar_data())
+
+    def update_connection_state(self, state):
         for screen in self.screen_windows:
-            for widget in self._get_all_screen_widgets(screen):
-                for barchart_widget in self._find_class_widgets(widget, BarChartInfoScreen):
-                    if hasattr(barchart_widget, "chart_view"):
-                        barchart_widget.chart_view.receive_data(data)
+            if hasattr(screen, "update_connection_state"):
+                screen.update_connection_state(state)
 
-    def handle_rotation_serial(self, rotation):
-        self.update_rotation({"rotation": rotation})
+    def handle_rotation_serial(self, rotation, screen_index=-1):
+        self.handle_message(RotationMessage.from_dict({"rotation": rotation}), screen_index)
 
     def handle_state_serial(self, state):
         state_map = {
@@ -143,7 +185,7 @@ class UIController:
                 "type": "state",
                 "state": mapped_state
             }
-            self.update_state(message)
+            self.handle_message(message)
         else:
             print(f"[Warning] Unknown state received from serial: {state}")
 
@@ -157,16 +199,6 @@ class UIController:
             widgets.append(screen.content_widget)
         return widgets
     
-    def _find_class_widgets(self, widget, widget_class):
-        found = []
-        if isinstance(widget, widget_class):
-            found.append(widget)
-        elif hasattr(widget, 'findChildren'):
-            children = widget.findChildren(QWidget)
-            for child in children:
-                found.extend(self._find_class_widgets(child, widget_class))
-        return found
-
     def _switch_bottom_screen(self):
         if len(self.screen_windows) < 2:
             return
@@ -176,42 +208,3 @@ class UIController:
         for widget in self._get_all_screen_widgets(bottom_screen):
             if isinstance(widget, DualScreenWidget):
                 widget.show_next()
-
-
-
-class StateTimerManager:
-    def __init__(self):
-        self.state_durations = {
-            "normal": 1,
-            "warning": 0,
-            "error": 0
-        }
-        self.current_state = "normal"
-
-    def set_state(self, state: str):
-        if state != self.current_state:
-            self.current_state = state
-
-    def _tick(self):
-        if self.current_state == "normal":
-            self.state_durations["normal"] += 1
-        elif self.current_state == "warning":
-            self.state_durations["warning"] += 1
-        elif self.current_state == "error":
-            self.state_durations["error"] += 1
-
-    def get_bar_data(self):
-        total_sec = sum(self.state_durations.values())
-        return {
-            "chart": {
-                "units": "sec",
-                "bars": [
-                    {"label": "Max. Speed", "value": self.state_durations["normal"]},
-                    {"label": "Reduced Speed", "value": self.state_durations["warning"]},
-                    {"label": "Stopped", "value": self.state_durations["error"]},
-                ]
-            },
-            "statMetric": "Total Time",
-            "statValue": format_time_sec(total_sec),
-            "statUnits": ""
-        }
@@ -12,6 +12,22 @@ from config.settings import GREEN_COLOR, YELLOW_COLOR, RED_COLOR
 import random
 import utils.utils as utils
 
+def create_animation(target, name):
+    # Owned by its target, so it is never left running in a reference cycle for the garbage collector:
+    # deleting a running animation inside another animation's start() deadlocks Qt.
+    animation = QPropertyAnimation(target, name, target)
+    animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+    animation.setDuration(1000)
+    return animation
+
+
+def restart_animation(animation, start_value, end_value):
+    animation.stop()
+    animation.setStartValue(start_value)
+    animation.setEndValue(end_value)
+    animation.start()
+
+
 class BarData:
     def __init__(self, label: str, value: float, formatted: str, color: QColor):
         self.label = label
@@ -29,6 +45,7 @@ class AnimatedBar(QObject):
         super().__init__()
         self._value = 0
         self.rect_item = rect_item
+        self.animation = create_animation(self, b"value")
 
     def get_value(self):
         return self._value
@@ -51,6 +68,7 @@ class AnimatedTextItem(QObject):
     def __init__(self, text_item):
         super().__init__()
         self.text_item = text_item
+        self.animation = create_animation(self, b"pos")
 
     def get_pos(self):
         return self.text_item.pos()
@@ -81,7 +99,7 @@ class BarChartView(QGraphicsView):
 
         self.bar_data = []         # Raw data received (list of dicts with keys 'label' and 'value')
         self.bar_display_data = [] # List[BarData]
-        self.bar_items = []        # Visual items: tuple(AnimatedBar, target_value, label_item, formatted_value_item)
+        self.bar_items = []        # Visual items: tuple(AnimatedBar, target_value, label_item, AnimatedTextItem)
 
         self.title_item = None
         self.subtitle_item = None
@@ -175,19 +193,21 @@ class BarChartView(QGraphicsView):
         else:
             self.bar_display_data = new_display_data
             QTimer.singleShot(50, self._animate_bars)
-            for i, (animated_bar, target_value, label_item, formatted_value_item) in enumerate(self.bar_items):
+            for i, (animated_bar, target_value, label_item, animated_text) in enumerate(self.bar_items):
                 _, new_value, new_formatted, _ = new_display_data[i].__dict__.values()
-                self.bar_items[i] = (animated_bar, new_value, label_item, formatted_value_item)
-                formatted_value_item.setPlainText(new_formatted)
+                self.bar_items[i] = (animated_bar, new_value, label_item, animated_text)
+                animated_text.text_item.setPlainText(new_formatted)
 
     def _create_bars(self):
         """
         Remove old bar items and create new ones based on the processed display data.
         """
-        for animated_bar, _, label_item, formatted_value_item in self.bar_items:
+        for animated_bar, _, label_item, animated_text in self.bar_items:
+            animated_bar.animation.stop()
+            animated_text.animation.stop()
             self.scene.removeItem(animated_bar.rect_item)
             self.scene.removeItem(label_item)
-            self.scene.removeItem(formatted_value_item)
+            self.scene.removeItem(animated_text.text_item)
         self.bar_items.clear()
 
         for i, bar in enumerate(self.bar_display_data):
@@ -212,7 +232,8 @@ class BarChartView(QGraphicsView):
             formatted_value_item.setPos(self.bar_x_offset + 5, y - self.bar_height / 8)
 
             animated_bar = AnimatedBar(rect_item)
-            self.bar_items.append((animated_bar, bar.value, label_item, formatted_value_item))
+            animated_text = AnimatedTextItem(formatted_value_item)
+            self.bar_items.append((animated_bar, bar.value, label_item, animated_text))
 
     def _animate_bars(self):
         """
@@ -221,27 +242,10 @@ class BarChartView(QGraphicsView):
         if not self.bar_items:
             return
         max_value = max(value for _, value, _, _ in self.bar_items)
-        for i, (animated_bar, value, _, formatted_value_item) in enumerate(self.bar_items):
+        for i, (animated_bar, value, _, animated_text) in enumerate(self.bar_items):
             y = self.y_start + 20 + i * self.spacing
             target_width = (value / max_value) * self.bar_max_width
 
-            anim = QPropertyAnimation(animated_bar, b"value")
-            anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-            anim.setDuration(1000)
-            anim.setStartValue(animated_bar.get_value())
-            anim.setEndValue(target_width)
-            anim.start()
-
-            animated_text = AnimatedTextItem(formatted_value_item)
-            anim_text = QPropertyAnimation(animated_text, b"pos")
-            anim_text.setEasingCurve(QEasingCurve.Type.OutCubic)
-            anim_text.setDuration(1000)
-            start_pos = animated_text.get_pos()
+            restart_animation(animated_bar.animation, animated_bar.get_value(), target_width)
             end_pos = QPointF(self.bar_x_offset + target_width + 5, y - self.bar_height / 8)
-            anim_text.setStartValue(start_pos)
-            anim_text.setEndValue(end_pos)
-            anim_text.start()
-
-            animated_bar.animation = anim
-            animated_text.animation = anim_text
-
+            restart_animation(animated_text.animation, animated_text.get_pos(), end_pos)
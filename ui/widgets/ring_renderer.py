@@ -0,0 +1,162 @@
+"""Ring rendering backends for RingViewWidget (RING_RENDERER)."""
+
+import math
+from collections import OrderedDict
+from PyQt6.QtGui import QPainter, QRadialGradient, QColor, QBrush, QPixmap, QRegion
+from PyQt6.QtCore import Qt, QRectF, QPointF, QRect
+from config.settings import RING_RENDERER, RING_SPRITE_CACHE_MB, RING_SPRITE_MAX_SIZE
+
+# Gradient stops are quantized to this many steps for the sprite keys.
+STOP_STEPS = 1024
+MIN_SPRITE_SIZE = 16
+# Pixels added around ring bounds for antialiasing and sprite scaling.
+DAMAGE_MARGIN = 2
+
+
+def ring_region(center, snapshot):
+    """
+    Pixels a snapshot paints around center: per visible ring, its bounding
+    square minus the square inscribed in its transparent inner disc.
+    """
+    region = QRegion()
+    cx, cy = center.x(), center.y()
+    for ring in snapshot:
+        if ring.alpha == 0:
+            continue
+        outer = math.ceil(ring.outer_radius) + DAMAGE_MARGIN
+        ring_area = QRegion(QRect(math.floor(cx) - outer, math.floor(cy) - outer, 2 * outer + 2, 2 * outer + 2))
+        hole = math.floor(ring.inner_stop * ring.outer_radius / math.sqrt(2)) - DAMAGE_MARGIN
+        if hole > 0:
+            ring_area = ring_area.subtracted(QRegion(QRect(math.ceil(cx) - hole, math.ceil(cy) - hole, 2 * hole, 2 * hole)))
+        region = region.united(ring_area)
+    return region
+
+
+def ring_gradient(center, outer_radius, inner_stop, mid_stop, color):
+    gradient = QRadialGradient(center.x(), center.y(), outer_radius)
+    gradient.setColorAt(0.0, QColor(0, 0, 0, 0))
+    gradient.setColorAt(inner_stop, QColor(0, 0, 0, 0))
+    gradient.setColorAt(mid_stop, color)
+    gradient.setColorAt(1.0, QColor(0, 0, 0, 0))
+    return gradient
+
+
+class GradientRingRenderer:
+    """Rasterizes a radial gradient per ring and frame."""
+
+    def paint(self, painter, center, snapshot, clip=None):
+        """Paint a RingManager snapshot (RingFrame list) around center, skipping rings outside clip."""
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for ring in snapshot:
+            outer_radius = ring.outer_radius
+            bounds = QRectF(center.x() - outer_radius, center.y() - outer_radius, 2 * outer_radius, 2 * outer_radius)
+            if clip is not None and not bounds.intersects(clip):
+                continue
+            base_color = QColor(*ring.color)
+            base_color.setAlpha(ring.alpha)
+
+            painter.setBrush(QBrush(ring_gradient(center, outer_radius, ring.inner_stop, ring.mid_stop, base_color)))
+            painter.drawEllipse(bounds)
+
+    def stats(self):
+        return {}
+
+
+class SpriteRingRenderer:
+    """
+    Blits pre-rendered ring sprites from a size-bounded LRU cache.
+
+    A ring's gradient depends on its radius only through scale, so a sprite
+    is keyed by the quantized gradient stops, the colour and a power-of-two
+    size covering the ring's diameter (up to RING_SPRITE_MAX_SIZE; larger
+    rings are scaled up from the largest sprite). The fade is applied as
+    painter opacity while blitting, so it needs no sprites of its own.
+    """
+
+    def __init__(self, max_bytes=RING_SPRITE_CACHE_MB * 1024 * 1024, max_size=RING_SPRITE_MAX_SIZE):
+        self.max_bytes = max_bytes
+        self.max_size = max_size
+        self._sprites = OrderedDict()
+        self._bytes = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.evicted_count = 0
+
+    def paint(self, painter, center, snapshot, clip=None):
+        """Paint a RingManager snapshot (RingFrame list) around center, blitting only what lands in clip."""
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        device = QRectF(0, 0, painter.device().width(), painter.device().height())
+        if clip is not None:
+            device = device.intersected(clip)
+        for ring in snapshot:
+            if ring.alpha == 0:
+                continue
+            outer_radius = ring.outer_radius
+            size = min(self.max_size, max(MIN_SPRITE_SIZE, 1 << math.ceil(math.log2(2 * outer_radius))))
+            sprite = self.sprite(size, ring.inner_stop, ring.mid_stop, ring.color)
+            target = QRectF(center.x() - outer_radius, center.y() - outer_radius, 2 * outer_radius, 2 * outer_radius)
+            # Only scale the part of the sprite that lands on the device (and clip).
+            clipped = target.intersected(device)
+            if clipped.isEmpty():
+                continue
+            scale = size / target.width()
+            source = QRectF((clipped.x() - target.x()) * scale, (clipped.y() - target.y()) * scale,
+                            clipped.width() * scale, clipped.height() * scale)
+            painter.setOpacity(ring.alpha / 255)
+            painter.drawPixmap(clipped, sprite, source)
+        painter.setOpacity(1.0)
+
+    def sprite(self, size, inner_stop, mid_stop, color):
+        key = (size, round(inner_stop * STOP_STEPS), round(mid_stop * STOP_STEPS), color)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hit_count += 1
+            self._sprites.move_to_end(key)
+            return sprite
+
+        self.miss_count += 1
+        sprite = QPixmap(size, size)
+        sprite.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(ring_gradient(
+            QPointF(size / 2, size / 2), size / 2, key[1] / STOP_STEPS, key[2] / STOP_STEPS, QColor(*color)
+        )))
+        painter.drawEllipse(QRectF(0, 0, size, size))
+        painter.end()
+
+        self._sprites[key] = sprite
+        self._bytes += size * size * 4
+        while self._bytes > self.max_bytes and len(self._sprites) > 1:
+            (old_size, *_), _ = self._sprites.popitem(last=False)
+            self._bytes -= old_size * old_size * 4
+            self.evicted_count += 1
+        return sprite
+
+    def stats(self):
+        return {
+            "sprites": len(self._sprites),
+            "bytes": self._bytes,
+            "hits": self.hit_count,
+            "misses": self.miss_count,
+            "evicted": self.evicted_count,
+        }
+
+
+RING_RENDERERS = {
+    "gradient": GradientRingRenderer,
+    "sprite": SpriteRingRenderer,
+}
+
+_shared = {}
+
+
+def shared_ring_renderer(name=RING_RENDERER):
+    """The renderer of the given backend shared by all RingViewWidgets, so they share one sprite cache."""
+    if name not in RING_RENDERERS:
+        raise ValueError(f"Unknown ring renderer: {name}")
+    if name not in _shared:
+        _shared[name] = RING_RENDERERS[name]()
+    return _shared[name]
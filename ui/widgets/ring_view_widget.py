@@ -1,9 +1,18 @@
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QRadialGradient, QColor, QBrush
-from PyQt6.QtCore import Qt, QRectF, QPointF
+from PyQt6.QtGui import QPainter, QRegion
+from PyQt6.QtCore import Qt, QPointF, QRectF
 from ui.ring_manager import RingManager
+from ui.widgets.ring_renderer import shared_ring_renderer, ring_region
 
 class RingViewWidget(QWidget):
+    """
+    Transparent overlay painting the shared rings.
+
+    Each frame only the pixels covered by the rings of the previous or the
+    current frame are invalidated, so small, faded or off-screen rings cost
+    correspondingly little repainting of the overlay and the content below.
+    """
+
     def __init__(self, ring_manager: RingManager, center: QPointF = None, is_ring_screen=False):
         super().__init__()
         self.ring_manager = ring_manager
@@ -13,46 +22,36 @@ class RingViewWidget(QWidget):
 
         self.center_point = center or QPointF(self.width() / 2, self.height() / 2)
 
-        self.ring_manager.rings_updated.connect(self.update)
+        self.ring_manager.rings_updated.connect(self.update_damage)
         self.is_ring_screen = is_ring_screen
-
+        self.renderer = shared_ring_renderer()
+
+        # Ring pixels painted in the last frame (local coordinates) and the center they were painted around.
+        self._painted_region = QRegion()
+        self._painted_center = None
+
+    def update_damage(self):
+        """Invalidate the region the rings covered in the last frame or cover in this one."""
+        center = self.mapFromGlobal(self.ring_manager.center)
+        region = ring_region(center, self.ring_manager.snapshot).intersected(self.rect())
+        if center != self._painted_center:
+            self._painted_center = center
+            damage = QRegion(self.rect())
+        else:
+            damage = region.united(self._painted_region)
+        self._painted_region = region
+        if not damage.isEmpty():
+            self.update(damage)
 
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setClipRegion(event.region())
 
         global_center = self.ring_manager.center
         center = self.mapFromGlobal(global_center)
 
-
-        for ring in self.ring_manager.rings:
-            R = ring.radius()
-            T = ring.thickness()
-            if T < 1.0:
-                continue
-
-            outer_radius = R + T / 2
-            gradient = QRadialGradient(center.x(), center.y(), outer_radius)
-            inner_stop = max(0, R - T / 2) / outer_radius
-            mid_stop = R / outer_radius
-
-            base_color = QColor(*ring.state.color)
-            base_color.setAlpha(int(255 * ring.fade_factor()))
-
-            gradient.setColorAt(0.0, QColor(0, 0, 0, 0))
-            gradient.setColorAt(inner_stop, QColor(0, 0, 0, 0))
-            gradient.setColorAt(mid_stop, base_color)
-            gradient.setColorAt(1.0, QColor(0, 0, 0, 0))
-
-            painter.setBrush(QBrush(gradient))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QRectF(
-                center.x() - outer_radius,
-                center.y() - outer_radius,
-                2 * outer_radius,
-                2 * outer_radius
-            ))
+        self.renderer.paint(painter, center, self.ring_manager.snapshot, QRectF(event.rect()))
 
 
     def resizeEvent(self, event):
@@ -13,4 +13,10 @@ class State(Enum):
     REDUCED_SPEED = "reduced_speed"
     STOPPED = "stopped"
     IDLE = "idle"
-    TASK_FINISHED = "task_finished"
\ No newline at end of file
+    TASK_FINISHED = "task_finished"
+
+class ConnectionState(Enum):
+    DISCONNECTED = "disconnected"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    BACKOFF = "backoff"
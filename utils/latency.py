@@ -0,0 +1,31 @@
+from collections import deque
+
+
+class LatencyStats:
+    """Latency samples in seconds: overall count and maximum, percentiles over the most recent window."""
+
+    def __init__(self, window=1000):
+        self._samples = deque(maxlen=window)
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, latency):
+        self._samples.append(latency)
+        self.count += 1
+        if latency > self.max:
+            self.max = latency
+
+    def percentile(self, fraction):
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self):
+        """Counters in milliseconds, e.g. for stats() dicts."""
+        return {
+            "count": self.count,
+            "p50_ms": round(self.percentile(0.5) * 1000, 2),
+            "p99_ms": round(self.percentile(0.99) * 1000, 2),
+            "max_ms": round(self.max * 1000, 2),
+        }
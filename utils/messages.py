@@ -0,0 +1,178 @@
+"""
+Typed robot messages.
+
+Each message type is a compact __slots__ struct whose fields are validated
+once when it is built from the decoded JSON object: absent fields are None,
+present fields of the wrong type raise ValueError. The structs also expose a
+read-only get()/[]/in interface keyed by the wire field names, so widgets that
+take plain configuration dicts accept them unchanged.
+"""
+
+from utils.enums import MessageType, State
+
+
+# Field validators: an absent field (None) passes, a value of the wrong type raises ValueError.
+
+def _int(value):
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return value
+    raise ValueError(f"expected an integer, got {value!r}")
+
+
+def _number(value):
+    if value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)):
+        return value
+    raise ValueError(f"expected a number, got {value!r}")
+
+
+def _str(value):
+    if value is None or isinstance(value, str):
+        return value
+    raise ValueError(f"expected a string, got {value!r}")
+
+
+class Message:
+    """Base class for typed messages."""
+    __slots__ = ()
+    type = None
+    # Maps wire field names to (attribute name, validator).
+    FIELDS = {}
+
+    @classmethod
+    def from_dict(cls, data):
+        message = cls.__new__(cls)
+        for key, (attr, validate) in cls.FIELDS.items():
+            try:
+                setattr(message, attr, validate(data.get(key)))
+            except ValueError as e:
+                raise ValueError(f"Invalid {cls.type.value} field {key!r}: {e}") from None
+        return message
+
+    def get(self, key, default=None):
+        if key == "type":
+            return self.type.value
+        field = self.FIELDS.get(key)
+        if field is None:
+            return default
+        value = getattr(self, field[0])
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        if (value := self.get(key)) is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def merged(self, newer):
+        """Return a copy updated with the fields that are set in a newer message."""
+        message = self.__class__.__new__(self.__class__)
+        for attr in self.__slots__:
+            value = getattr(newer, attr)
+            setattr(message, attr, getattr(self, attr) if value is None else value)
+        return message
+
+    def to_dict(self):
+        data = {"type": self.type.value}
+        for key in self.FIELDS:
+            if (value := self.get(key)) is not None:
+                data[key] = value
+        return data
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class StateMessage(Message):
+    __slots__ = ("state", "screen1_text0", "screen1_text1", "screen2_text0", "screen2_text1")
+    type = MessageType.STATE
+    FIELDS = {
+        "state": ("state", State),
+        "screen1Text0": ("screen1_text0", _str),
+        "screen1Text1": ("screen1_text1", _str),
+        "screen2Text0": ("screen2_text0", _str),
+        "screen2Text1": ("screen2_text1", _str),
+    }
+
+    def get(self, key, default=None):
+        if key == "state":
+            return self.state.value
+        return super().get(key, default)
+
+    @property
+    def has_text_overrides(self):
+        return any(getattr(self, attr) is not None for attr in self.__slots__[1:])
+
+
+class RotationMessage(Message):
+    __slots__ = ("rotation",)
+    type = MessageType.ROTATION
+    FIELDS = {
+        "rotation": ("rotation", _number),
+    }
+
+
+class LiveStatsMessage(Message):
+    __slots__ = ("current_speed", "current_box", "remaining_time", "current_pallet", "total_boxes", "total_pallets")
+    type = MessageType.LIVE_STATS
+    FIELDS = {
+        "currentSpeed": ("current_speed", _int),
+        "currentBox": ("current_box", _int),
+        "remainingTime": ("remaining_time", _int),
+        "currentPallet": ("current_pallet", _int),
+        "totalBoxes": ("total_boxes", _int),
+        "totalPallets": ("total_pallets", _int),
+    }
+
+
+def _chart(chart):
+    if chart is None:
+        return None
+    if not isinstance(chart, dict):
+        raise ValueError(f"expected an object, got {chart!r}")
+    validated = {}
+    if (units := _str(chart.get("units"))) is not None:
+        validated["units"] = units
+    if (bars := chart.get("bars")) is not None:
+        if not isinstance(bars, list) or not all(isinstance(bar, dict) for bar in bars):
+            raise ValueError(f"expected a list of bar objects, got {bars!r}")
+        validated["bars"] = [
+            {"label": str(bar.get("label", "")), "value": _number(bar.get("value")) or 0}
+            for bar in bars
+        ]
+    return validated
+
+
+class GlobalStatsMessage(Message):
+    __slots__ = ("chart", "stat_metric", "stat_value", "stat_units")
+    type = MessageType.GLOBAL_STATS
+    FIELDS = {
+        "chart": ("chart", _chart),
+        "statMetric": ("stat_metric", _str),
+        "statValue": ("stat_value", lambda value: None if value is None else str(value)),
+        "statUnits": ("stat_units", _str),
+    }
+
+
+MESSAGE_CLASSES = {cls.type: cls for cls in (StateMessage, RotationMessage, LiveStatsMessage, GlobalStatsMessage)}
+
+
+def as_message(message):
+    """
+    Return the typed message for a decoded JSON object, or the message itself if already typed.
+    Raises ValueError for unknown message types, an invalid state and fields of the wrong type.
+    """
+    if isinstance(message, Message):
+        return message
+    if not isinstance(message, dict):
+        raise ValueError(f"Expected a JSON object, got {type(message).__name__}")
+    return MESSAGE_CLASSES[MessageType(message.get("type"))].from_dict(message)
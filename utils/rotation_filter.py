@@ -0,0 +1,118 @@
+"""
+Smoothing and latency-compensating prediction for rotation samples in degrees.
+
+Both filters track the angle and its rate of change, unwrap the input across
+the +/-180 boundary and return the angle extrapolated `lead` seconds ahead.
+"""
+
+import math
+from config.settings import (
+    ROTATION_FILTER, ROTATION_PREDICTION_MS, ROTATION_ONE_EURO_MIN_CUTOFF, ROTATION_ONE_EURO_BETA,
+    ROTATION_KALMAN_PROCESS_NOISE, ROTATION_KALMAN_MEASUREMENT_NOISE
+)
+
+
+def wrap_degrees(angle):
+    return (angle + 180) % 360 - 180
+
+
+class OneEuroFilter:
+    """
+    One-Euro filter (Casiez et al.): heavy smoothing while the angle is still,
+    with the cutoff rising with speed so fast motion is followed without lag.
+    """
+
+    def __init__(self, min_cutoff=ROTATION_ONE_EURO_MIN_CUTOFF, beta=ROTATION_ONE_EURO_BETA, d_cutoff=1.0,
+                 lead=ROTATION_PREDICTION_MS / 1000):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.lead = lead
+        self.reset()
+
+    def reset(self):
+        self._angle = None
+        self._rate = 0.0
+        self._time = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1 / (2 * math.pi * cutoff)
+        return 1 / (1 + tau / dt)
+
+    def update(self, angle, timestamp):
+        """Add a sample taken at timestamp (seconds) and return the filtered, predicted angle."""
+        if self._angle is None:
+            self._angle = angle
+            self._time = timestamp
+            return angle
+        dt = timestamp - self._time
+        if dt > 0:
+            angle = self._angle + wrap_degrees(angle - self._angle)
+            self._rate += self._alpha(self.d_cutoff, dt) * ((angle - self._angle) / dt - self._rate)
+            cutoff = self.min_cutoff + self.beta * abs(self._rate)
+            self._angle += self._alpha(cutoff, dt) * (angle - self._angle)
+            self._time = timestamp
+        return self._angle + self._rate * self.lead
+
+
+class KalmanRotationFilter:
+    """
+    Constant angular-rate Kalman filter; process_noise is the variance of the
+    angular acceleration ((deg/s^2)^2), measurement_noise that of a sample (deg^2).
+    """
+
+    def __init__(self, process_noise=ROTATION_KALMAN_PROCESS_NOISE,
+                 measurement_noise=ROTATION_KALMAN_MEASUREMENT_NOISE, lead=ROTATION_PREDICTION_MS / 1000):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.lead = lead
+        self.reset()
+
+    def reset(self):
+        self._angle = None
+        self._rate = 0.0
+        self._time = None
+        self._p = [[self.measurement_noise, 0.0], [0.0, 1e4]]
+
+    def update(self, angle, timestamp):
+        """Add a sample taken at timestamp (seconds) and return the filtered, predicted angle."""
+        if self._angle is None:
+            self._angle = angle
+            self._time = timestamp
+            return angle
+        dt = max(timestamp - self._time, 0.0)
+        self._time = timestamp
+        (p00, p01), (p10, p11) = self._p
+
+        # Predict with the constant-rate model.
+        self._angle += self._rate * dt
+        q = self.process_noise
+        p00 += dt * (p10 + p01) + dt * dt * p11 + q * dt ** 4 / 4
+        p01 += dt * p11 + q * dt ** 3 / 2
+        p10 += dt * p11 + q * dt ** 3 / 2
+        p11 += q * dt * dt
+
+        # Correct with the measured angle.
+        residual = wrap_degrees(angle - self._angle)
+        s = p00 + self.measurement_noise
+        k0, k1 = p00 / s, p10 / s
+        self._angle += k0 * residual
+        self._rate += k1 * residual
+        self._p = [[(1 - k0) * p00, (1 - k0) * p01], [p10 - k1 * p00, p11 - k1 * p01]]
+        return self._angle + self._rate * self.lead
+
+
+ROTATION_FILTERS = {
+    "one_euro": OneEuroFilter,
+    "kalman": KalmanRotationFilter,
+}
+
+
+def create_rotation_filter(name=ROTATION_FILTER):
+    """Create the configured filter, or None if filtering is disabled."""
+    if not name:
+        return None
+    if name not in ROTATION_FILTERS:
+        raise ValueError(f"Unknown rotation filter: {name}")
+    return ROTATION_FILTERS[name]()
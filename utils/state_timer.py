@@ -0,0 +1,183 @@
+"""Time spent per robot state, accounted from monotonic transition timestamps."""
+
+import atexit
+import bisect
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from config.settings import STATE_TIMER_PATH, STATE_TIMER_WINDOW, SHIFT_START_HOURS
+from utils.utils import format_time_sec
+
+TRACKED_STATES = ("normal", "warning", "error")
+STATE_TIMER_WINDOWS = ("session", "hour", "shift", "today")
+
+# Transitions older than the longest window (today) are dropped, in batches.
+HISTORY_SECONDS = 25 * 3600
+PRUNE_BATCH = 256
+SAVE_INTERVAL = 60.0
+
+
+class StateTimerManager:
+    """
+    Durations per tracked state over a rolling window, without ticking.
+
+    Every transition stores its monotonic timestamp and the running totals per
+    state up to it, so the totals at any instant are one transition lookup
+    away. Windows only move forward, so each keeps a cursor into the
+    transitions that advances amortized O(1) per query.
+
+    With a path, the transitions are saved as wall-clock times every
+    SAVE_INTERVAL seconds and at exit, never per transition, and loaded
+    again on start; the time the app was not running counts for no state.
+    """
+
+    def __init__(self, path=STATE_TIMER_PATH, window=STATE_TIMER_WINDOW, clock=time.monotonic, wall_clock=time.time):
+        if window not in STATE_TIMER_WINDOWS:
+            raise ValueError(f"Unknown state timer window: {window}")
+        self.path = path
+        self.window = window
+        self._clock = clock
+        now = clock()
+        self._wall_offset = wall_clock() - now
+        self.session_start = now
+
+        # Transition i: at _times[i] the state became _states[i], after _totals[i] seconds per tracked state.
+        self._times = []
+        self._states = []
+        self._totals = []
+        self._cursors = {}
+        self._last_save = now
+
+        if path:
+            self._load(now)
+            atexit.register(self.save)
+        self._append(now, "normal")
+
+    @property
+    def current_state(self):
+        return self._states[-1]
+
+    def set_state(self, state: str):
+        if state != self.current_state:
+            self._append(self._clock(), state)
+
+    def _append(self, timestamp, state):
+        totals = self._totals_after(len(self._times) - 1, timestamp) if self._times else (0.0,) * len(TRACKED_STATES)
+        self._times.append(timestamp)
+        self._states.append(state)
+        self._totals.append(totals)
+        self._prune(timestamp - HISTORY_SECONDS)
+
+    def _totals_after(self, index, timestamp):
+        """Totals at timestamp, given that transition index is the last one before it."""
+        totals = self._totals[index]
+        state = self._states[index]
+        if state not in TRACKED_STATES:
+            return totals
+        position = TRACKED_STATES.index(state)
+        return totals[:position] + (totals[position] + timestamp - self._times[index],) + totals[position + 1:]
+
+    def _index_at(self, timestamp, window):
+        """Index of the last transition at or before timestamp (-1 if none), advancing the window's cursor."""
+        index = self._cursors.get(window)
+        if index is None or (index >= 0 and self._times[index] > timestamp):
+            index = bisect.bisect_right(self._times, timestamp) - 1
+        else:
+            last = len(self._times) - 1
+            while index < last and self._times[index + 1] <= timestamp:
+                index += 1
+        self._cursors[window] = index
+        return index
+
+    def _prune(self, cutoff):
+        # Keep the transition in effect at the cutoff.
+        drop = bisect.bisect_right(self._times, cutoff) - 1
+        if drop < PRUNE_BATCH:
+            return
+        del self._times[:drop], self._states[:drop], self._totals[:drop]
+        self._cursors = {window: max(-1, index - drop) for window, index in self._cursors.items()}
+
+    def window_start(self, window, now):
+        if window == "session":
+            return self.session_start
+        if window == "hour":
+            return now - 3600
+        local = datetime.fromtimestamp(now + self._wall_offset)
+        if window == "today":
+            start = local.replace(hour=0, minute=0, second=0, microsecond=0)
+        else:
+            hours = sorted(SHIFT_START_HOURS)
+            started = [hour for hour in hours if hour <= local.hour]
+            start = local.replace(hour=started[-1] if started else hours[-1], minute=0, second=0, microsecond=0)
+            if not started:
+                start -= timedelta(days=1)
+        return start.timestamp() - self._wall_offset
+
+    def durations(self, window=None, now=None):
+        """Seconds spent per tracked state within the window (default: the configured one), up to now."""
+        window = window or self.window
+        now = self._clock() if now is None else now
+        end = self._totals_after(len(self._times) - 1, now)
+        window_start = self.window_start(window, now)
+        index = self._index_at(window_start, window)
+        start = self._totals_after(index, window_start) if index >= 0 else (0.0,) * len(end)
+        return {state: end[i] - start[i] for i, state in enumerate(TRACKED_STATES)}
+
+    def get_bar_data(self):
+        durations = {state: round(seconds) for state, seconds in self.durations().items()}
+        if self.path and self._clock() - self._last_save >= SAVE_INTERVAL:
+            self.save()
+        return {
+            "chart": {
+                "units": "sec",
+                "bars": [
+                    {"label": "Max. Speed", "value": durations["normal"]},
+                    {"label": "Reduced Speed", "value": durations["warning"]},
+                    {"label": "Stopped", "value": durations["error"]},
+                ]
+            },
+            "statMetric": "Total Time",
+            "statValue": format_time_sec(sum(durations.values())),
+            "statUnits": ""
+        }
+
+    def save(self):
+        """Write the transitions, as wall-clock times, atomically to the path."""
+        now = self._clock()
+        self._last_save = now
+        offset = self._wall_offset
+        data = {
+            "saved_at": now + offset,
+            "transitions": [
+                [timestamp + offset, state, totals]
+                for timestamp, state, totals in zip(self._times, self._states, self._totals)
+            ],
+        }
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"[StateTimer] Could not save state durations to {self.path}: {e}")
+
+    def _load(self, now):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            offset = self._wall_offset
+            for timestamp, state, totals in data["transitions"]:
+                self._times.append(min(timestamp - offset, now))
+                self._states.append(state)
+                self._totals.append(tuple(totals))
+            stopped = min(data["saved_at"] - offset, now)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"[StateTimer] Ignoring unreadable state durations in {self.path}: {e}")
+            self._times, self._states, self._totals = [], [], []
+            return
+        if self._times:
+            # The app was not running from the last save until now.
+            self._append(max(stopped, self._times[-1]), "")